@@ -17,7 +17,7 @@ from llama_index.core.instrumentation.events.llm import (
     LLMChatStartEvent,
     LLMCompletionEndEvent,
 )
-from llama_index.core.llms import MockLLM
+from llama_index.core.llms import ChatMessage, MessageRole, MockLLM
 from llama_index.core.response_synthesizers import CompactAndRefine, TreeSummarize
 from llama_index.core.retrievers import BaseRetriever, QueryFusionRetriever
 from llama_index.core.vector_stores.types import MetadataFilter, MetadataFilters
@@ -68,34 +68,48 @@ if settings.DEBUG:
     root_dispatcher.add_event_handler(ModelEventHandler())
 
 
+def _chat_message_parts(msg):
+    return msg.role.value, msg.content
+
+
+def _dict_message_parts(msg):
+    try:
+        role = MessageRole(msg.get("role") or MessageRole.USER)
+    except ValueError:
+        # Skip entries with an unknown role
+        return None
+    return role.value, msg.get("content")
+
+
+# Extracts (role, content) from each supported type of chat history entry
+_MESSAGE_PARTS_BY_TYPE = {
+    ChatMessage: _chat_message_parts,
+    dict: _dict_message_parts,
+}
+
+
+def _format_chat_message(msg):
+    extract = _MESSAGE_PARTS_BY_TYPE.get(type(msg))
+    if extract is None:
+        if not isinstance(msg, ChatMessage):
+            # Skip None or invalid entries
+            return None
+        extract = _chat_message_parts
+    parts = extract(msg)
+    if not parts or not parts[1]:
+        return None
+    return f"{parts[0]}: {parts[1]}"
+
+
 def chat_history_to_prompt(chat_history: list) -> str:
     """
-    Convert a list of ChatMessage objects to a single prompt string.
-    Each message will be formatted as: "<role>: <content>"
+    Convert a list of ChatMessage objects (or equivalent dicts) to a single prompt
+    string. Each message will be formatted as: "<role>: <content>"
     """
-    from llama_index.core.base.llms.types import ChatMessage
-
-    lines = []
-    for msg in chat_history:
-        # Skip None or invalid entries
-        if msg is None:
-            continue
-
-        # If msg is a dict, try to convert to ChatMessage
-        if not isinstance(msg, ChatMessage) and hasattr(ChatMessage, "model_validate"):
-            try:
-                msg = ChatMessage.model_validate(msg)
-            except Exception:
-                # Skip invalid entries that can't be validated
-                continue
-
-        role = getattr(msg, "role", None)
-        content = getattr(msg, "content", None)
-        if role and content:
-            lines.append(f"{role.value}: {content}")
-        elif content:
-            lines.append(str(content))
-    return "\n".join(lines)
+    if not chat_history:
+        return ""
+    lines = (_format_chat_message(msg) for msg in chat_history)
+    return "\n".join(line for line in lines if line)
 
 
 class OttoLLM:
@@ -110,14 +124,16 @@ class OttoLLM:
         temperature: float = 0.1,
         mock_embedding: bool = False,
         reasoning_effort: str = "minimal",
+        system_prompt: str | None = None,
     ):
         # Check if mock_llm is enabled via contextvar (for load testing)
         self.use_mock_llm = mock_llm_context.get(False)
 
         # "minimal" reasoning effort only valid for gpt-5 models
-        if reasoning_effort == "minimal" and not deployment.startswith("gpt-5"):
+        if reasoning_effort == "minimal" and not (deployment or "").startswith("gpt-5"):
             reasoning_effort = "low"
 
+        # A None deployment falls back to the default chat model
         self.llm_config = get_model(deployment)
         if not self.llm_config:
             raise ValueError(f"Invalid deployment: {deployment}")
@@ -126,6 +142,9 @@ class OttoLLM:
         self.model = self.llm_config.deployment_name
         self.temperature = temperature
         self.reasoning_effort = reasoning_effort
+        # Instruction prefix shared by every complete() call on this instance.
+        # Sent as a system instruction so Gemini sees an identical, cacheable prefix.
+        self.system_prompt = system_prompt
         # Use gemini-2.0-flash for token counting as it's faster and more reliable
         # Note: All Gemini models use the same tokenizer, so any model works for counting
 
@@ -179,7 +198,15 @@ class OttoLLM:
         """
         Return complete response string from single prompt string (no streaming)
         """
-        return self.llm.complete(prompt).text
+        if not self.system_prompt:
+            return self.llm.complete(prompt).text
+        if not self.llm_config.supports_chat_history:
+            return self.llm.complete(f"{self.system_prompt}\n\n{prompt}").text
+        messages = [
+            ChatMessage(role=MessageRole.SYSTEM, content=self.system_prompt),
+            ChatMessage(role=MessageRole.USER, content=prompt),
+        ]
+        return self.llm.chat(messages).message.content
 
     def chat_complete(self, chat_history: list):
         """
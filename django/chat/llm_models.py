@@ -1,5 +1,6 @@
 from enum import Enum
-from typing import Dict, List, Optional
+from types import MappingProxyType
+from typing import List, Mapping, Optional
 
 from django.utils.translation import get_language
 from django.utils.translation import gettext_lazy as _
@@ -16,7 +17,11 @@ class LLM(BaseModel):
     Defines the configuration for a single Large Language Model.
     """
 
-    model_config = ConfigDict(protected_namespaces=(), arbitrary_types_allowed=True)
+    # Model definitions are shared, import-time constants, so they are immutable
+    # (and therefore hashable)
+    model_config = ConfigDict(
+        protected_namespaces=(), arbitrary_types_allowed=True, frozen=True
+    )
 
     model_id: str = Field(
         ...,
@@ -120,8 +125,14 @@ ALL_MODELS: List[LLM] = [
     ),
 ]
 
-# A dictionary for quick lookups by model_id
-MODELS_BY_ID: Dict[str, LLM] = {model.model_id: model for model in ALL_MODELS}
+# A read-only dictionary for quick lookups by model_id
+MODELS_BY_ID: Mapping[str, LLM] = MappingProxyType(
+    {model.model_id: model for model in ALL_MODELS}
+)
+
+# Materialized once for callers that iterate over all models or only active ones
+MODELS_TUPLE: tuple[LLM, ...] = tuple(MODELS_BY_ID.values())
+ACTIVE_MODELS: tuple[LLM, ...] = tuple(m for m in MODELS_TUPLE if m.is_active)
 
 
 def get_chat_model_choices() -> List[tuple[str, str]]:
@@ -131,9 +142,8 @@ def get_chat_model_choices() -> List[tuple[str, str]]:
     """
     return [
         (model.model_id, model.description)
-        for model in ALL_MODELS
-        if model.is_active
-        # and not model.deprecated_by
+        for model in ACTIVE_MODELS
+        # if not model.deprecated_by
     ]
 
 
@@ -146,17 +156,14 @@ def get_grouped_chat_model_choices() -> list[tuple[str, list[tuple[str, dict]]]]
     from collections import defaultdict
 
     groups = defaultdict(list)
-    for model in ALL_MODELS:
-        if (
-            model.is_active
-            # and not model.deprecated_by
-        ):
-            groups[model.group].append(
-                (
-                    model.model_id,
-                    {"label": model.description, "is-reasoning": model.reasoning},
-                )
+    for model in ACTIVE_MODELS:
+        # if not model.deprecated_by
+        groups[model.group].append(
+            (
+                model.model_id,
+                {"label": model.description, "is-reasoning": model.reasoning},
             )
+        )
 
     # Return as a list of (group, choices) tuples, sorted by group name
     # Sort groups so that any group containing "Legacy" or "obsolète" comes last
@@ -181,7 +188,7 @@ DEFAULT_TRANSLATE_MODEL_ID = "gemini-1.5-flash"
 DEFAULT_LAWS_MODEL_ID = "gemini-1.5-pro"
 
 
-def get_model(model_id: str) -> LLM:
+def get_model(model_id: str | None) -> LLM:
     """
     Retrieves a model by its ID. If the model is deprecated, it returns
     the model that replaces it. If the model_id is not found, it returns
@@ -193,7 +200,8 @@ def get_model(model_id: str) -> LLM:
         return get_model(model.deprecated_by)
     if model and model.is_active:
         return model
-    # Fallback to default if model_id is invalid
+    # Fallback to default if model_id is invalid (or None). Looked up at call time
+    # so that a patched MODELS_BY_ID supplies the default too
     return MODELS_BY_ID[DEFAULT_CHAT_MODEL_ID]
 
 
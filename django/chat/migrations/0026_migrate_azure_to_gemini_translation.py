@@ -1,6 +1,23 @@
 # Generated migration to migrate Azure translation to Gemini
 from django.db import migrations
 
+# Update in bounded batches; with the migration non-atomic, each batch commits on
+# its own so that large tables don't produce one huge transaction
+BATCH_SIZE = 30000
+
+
+def update_in_batches(queryset, **values):
+    """
+    Apply queryset.update(**values) in batches of BATCH_SIZE primary keys and
+    return the total number of rows updated
+    """
+    updated = 0
+    while True:
+        pks = list(queryset.values_list("pk", flat=True)[:BATCH_SIZE])
+        if not pks:
+            return updated
+        updated += queryset.model.objects.filter(pk__in=pks).update(**values)
+
 
 def migrate_azure_to_gemini(apps, schema_editor):
     """
@@ -14,9 +31,9 @@ def migrate_azure_to_gemini(apps, schema_editor):
 
     # Update all Azure translation model references to Gemini
     azure_options = ChatOptions.objects.filter(translate_model__in=["azure", "azure_custom"])
-    azure_options.update(translate_model="gemini-1.5-flash")
+    updated = update_in_batches(azure_options, translate_model="gemini-1.5-flash")
 
-    print(f"Migrated {azure_options.count()} ChatOptions from Azure to Gemini translation")
+    print(f"Migrated {updated} ChatOptions from Azure to Gemini translation")
 
 
 def reverse_migrate(apps, schema_editor):
@@ -26,13 +43,17 @@ def reverse_migrate(apps, schema_editor):
     """
     ChatOptions = apps.get_model("chat", "ChatOptions")
 
-    gemini_options = ChatOptions.objects.filter(translate_model__startswith="gemini")
-    gemini_options.update(translate_model="azure")
+    # Only undo the value the forward migration wrote
+    gemini_options = ChatOptions.objects.filter(translate_model="gemini-1.5-flash")
+    updated = update_in_batches(gemini_options, translate_model="azure")
 
-    print(f"Rolled back {gemini_options.count()} ChatOptions from Gemini to Azure translation")
+    print(f"Rolled back {updated} ChatOptions from Gemini to Azure translation")
 
 
 class Migration(migrations.Migration):
+    # Let each batch commit separately. Both directions only touch rows that still
+    # hold the old value, so an interrupted run can simply be re-run
+    atomic = False
 
     dependencies = [
         ('chat', '0025_alter_chatoptions_chat_reasoning_effort_and_more'),
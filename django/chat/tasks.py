@@ -1,6 +1,10 @@
-import os
 import uuid
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from pathlib import PurePath
+
+from django.core.files.base import ContentFile
 
 from celery import shared_task
 from celery.exceptions import SoftTimeLimitExceeded
@@ -8,11 +12,73 @@ from structlog import get_logger
 from structlog.contextvars import bind_contextvars, get_contextvars
 
 from chat.llm import OttoLLM
+from chat.models import ChatFile, Message
 from chat.utils import swap_glossary_columns
+from librarian.utils.process_engine import (
+    extract_markdown,
+    get_process_engine_from_type,
+    guess_content_type,
+)
 from otto.models import Cost
+from otto.utils.llm_cache import llm_cache
 
 logger = get_logger(__name__)
 ten_minutes = 600
+# Translation requests are split on paragraph boundaries into chunks of roughly
+# this many tokens (estimated at ~4 characters per token) and sent in parallel
+translation_chunk_tokens = 3000
+translation_max_workers = 4
+# Content type sniffing only needs the start of a file
+content_sniff_bytes = 1 << 16
+
+
+def _read_paragraph_chunks(file_handle, max_tokens=translation_chunk_tokens):
+    """
+    Yield chunks of text from a file handle, splitting on blank lines once a chunk
+    reaches max_tokens (estimated as len // 4). Paragraphs that run far past the
+    limit are split on the next line break instead.
+    """
+    max_chars = max_tokens * 4
+    chunk = []
+    chunk_chars = 0
+    for line in file_handle:
+        chunk.append(line)
+        chunk_chars += len(line)
+        if chunk_chars >= max_chars and (
+            not line.strip() or chunk_chars >= 2 * max_chars
+        ):
+            yield "".join(chunk)
+            chunk = []
+            chunk_chars = 0
+    if chunk:
+        yield "".join(chunk)
+
+
+def _map_bounded(executor, fn, iterable, window):
+    """
+    Like executor.map, but keeps at most `window` calls in flight so that the input
+    iterable is consumed as results are used rather than all up front.
+    """
+    pending = deque()
+    for item in iterable:
+        if len(pending) >= window:
+            yield pending.popleft().result()
+        pending.append(executor.submit(fn, item))
+    while pending:
+        yield pending.popleft().result()
+
+
+def _translate_chunk(llm, chunk):
+    """
+    Translate a chunk, keeping its original leading and trailing whitespace so that
+    the translated chunks can be concatenated back into the document's layout.
+    """
+    text = chunk.strip()
+    if not text:
+        return chunk
+    leading = chunk[: len(chunk) - len(chunk.lstrip())]
+    trailing = chunk[len(chunk.rstrip()) :]
+    return leading + llm_cache.complete(llm, text).strip() + trailing
 
 
 @shared_task(soft_time_limit=ten_minutes)
@@ -22,13 +88,6 @@ def extract_text_task(file_id, pdf_method="default", context_vars=None):
     Returns the file_id when complete, or raises an exception on error.
     """
     try:
-        from chat.models import ChatFile
-        from librarian.utils.process_engine import (
-            extract_markdown,
-            get_process_engine_from_type,
-            guess_content_type,
-        )
-
         # Bind context variables for cost tracking
         if context_vars:
             bind_contextvars(**context_vars)
@@ -40,8 +99,13 @@ def extract_text_task(file_id, pdf_method="default", context_vars=None):
 
         with file.saved_file.file.open("rb") as file_handle:
             content = file_handle.read()
+            # Sniff the content type from the first 64 KiB only, so that untrusted
+            # content types don't decode the entire document looking for markers.
+            # "<html" or "<root" appearing later in a file is not detected.
             content_type = guess_content_type(
-                content, file.saved_file.content_type, file.filename
+                content[:content_sniff_bytes],
+                file.saved_file.content_type,
+                file.filename,
             )
             process_engine = get_process_engine_from_type(content_type)
             extraction_result = extract_markdown(
@@ -64,22 +128,30 @@ def translate_file(
     if target_language == "fr":
         target_language = "fr-ca"
     try:
-        from chat.models import ChatFile, Message
-        from django.core.files.base import ContentFile
-
-        with open(file_path, "rb") as f:
-            file_content = f.read()
+        # A single OttoLLM is shared by all chunks so that costs are aggregated.
+        # The instruction is the system prompt, leaving each chunk as the only
+        # part of the request that varies.
+        llm = OttoLLM(
+            deployment="gemini-1.5-flash",
+            temperature=0,
+            system_prompt=f"Translate the following document to {target_language}:",
+        )
 
-        llm = OttoLLM(deployment="gemini-1.5-flash")
-        prompt = f"Translate the following document to {target_language}:\n\n{file_content.decode('utf-8')}"
-        translated_text = llm.complete(prompt)
+        with open(file_path, "r", encoding="utf-8", buffering=1 << 20) as f:
+            with ThreadPoolExecutor(max_workers=translation_max_workers) as executor:
+                translated_text = "".join(
+                    _map_bounded(
+                        executor,
+                        lambda chunk: _translate_chunk(llm, chunk),
+                        _read_paragraph_chunks(f),
+                        window=translation_max_workers,
+                    )
+                )
         llm.create_costs()
 
-        file_name = file_path.split("/")[-1]
-        file_extension = os.path.splitext(file_name)[1]
-        file_name_without_extension = os.path.splitext(file_name)[0]
+        input_path = PurePath(file_path)
         output_file_name = (
-            f"{file_name_without_extension}_{target_language.upper()}{file_extension}"
+            f"{input_path.stem}_{target_language.upper()}{input_path.suffix}"
         )
 
         request_context = get_contextvars()
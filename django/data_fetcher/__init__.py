@@ -1,10 +1,47 @@
-# Placeholder for data_fetcher package
-# This file was created to resolve ModuleNotFoundError during testing.
+# Minimal stand-in for the data_fetcher package
+import functools
+
+from django.core.signals import request_finished, request_started
+
+from asgiref.local import Local
+
+# Per-request cache storage. Local is context-aware, so concurrent requests under
+# ASGI don't share a cache even when they run on the same thread.
+_request_local = Local()
+
+
+def _start_request_cache(**kwargs):
+    _request_local.cache = {}
+
+
+def _clear_request_cache(**kwargs):
+    _request_local.cache = None
+
+
+request_started.connect(_start_request_cache, dispatch_uid="data_fetcher_start")
+request_finished.connect(_clear_request_cache, dispatch_uid="data_fetcher_finish")
+
 
 def cache_within_request(func):
     """
-    Placeholder decorator for caching within request.
+    Cache the return value of func for the duration of the current request.
+    Outside of a request (e.g. Celery tasks, management commands) func is called
+    every time, since there is nothing to bound the lifetime of the cache.
     """
+
+    @functools.wraps(func)
     def wrapper(*args, **kwargs):
-        return func(*args, **kwargs)
+        cache = getattr(_request_local, "cache", None)
+        if cache is None:
+            return func(*args, **kwargs)
+        try:
+            key = (func, args, tuple(sorted(kwargs.items())))
+            if key in cache:
+                return cache[key]
+        except TypeError:
+            # Unhashable arguments can't be cached
+            return func(*args, **kwargs)
+        result = cache[key] = func(*args, **kwargs)
+        return result
+
     return wrapper
@@ -1,14 +1,20 @@
 # Placeholder for data_fetcher.util module
 # This file was created to resolve ModuleNotFoundError during testing.
 
+from data_fetcher import _request_local
+
+
 def get_request():
     """
     Placeholder function for getting the current request.
     """
     return None
 
+
 def clear_request_caches():
     """
-    Placeholder function for clearing request caches.
+    Clear values cached with cache_within_request during the current request,
+    e.g. after a write that changes what they would return.
     """
-    pass
+    if getattr(_request_local, "cache", None) is not None:
+        _request_local.cache = {}
@@ -11,6 +11,7 @@ from django.utils.translation import get_language
 from django.utils.translation import gettext_lazy as _
 
 from celery.result import AsyncResult
+from data_fetcher.util import clear_request_caches
 from sqlalchemy import create_engine, text
 from sqlalchemy.engine import reflection
 from sqlalchemy.orm import sessionmaker
@@ -633,3 +634,10 @@ def document_post_delete(sender, instance, **kwargs):
         )
     except Exception as e:
         logger.error(f"Document post delete error: {e}")
+
+
+@receiver(post_save, sender=LibraryUserRole)
+@receiver(post_delete, sender=LibraryUserRole)
+def library_user_role_changed(sender, instance, **kwargs):
+    # Roles are cached for the request by otto.rules.get_library_roles_for_user
+    clear_request_caches()
@@ -189,7 +189,8 @@ def process_document_helper(document, llm, pdf_method="default"):
     document.save()
 
 
-@shared_task(soft_time_limit=ten_minutes)
+# Deleting is idempotent, so the task is acknowledged only once it completes
+@shared_task(soft_time_limit=ten_minutes, acks_late=True)
 def delete_documents_from_vector_store(
     document_uuids: List[str], library_uuid: str
 ) -> None:
@@ -5,6 +5,7 @@ import re
 import subprocess
 import tempfile
 import uuid
+from functools import lru_cache
 from urllib.parse import urljoin
 
 from django.conf import settings
@@ -141,11 +142,9 @@ def create_nodes(chunks, document):
     return new_nodes
 
 
-def guess_content_type(
-    content: str | bytes, content_type: str = "", path: str = ""
-) -> str:
-    # We consider these content types to be reliable and do not need further guessing
-    trusted_content_types = [
+# We consider these content types to be reliable and do not need further guessing
+TRUSTED_CONTENT_TYPES = frozenset(
+    [
         "application/pdf",
         "application/xml",
         "application/vnd.ms-outlook",
@@ -171,8 +170,13 @@ def guess_content_type(
         "image/heif",
         "image/heic",
     ]
+)
+
 
-    if content_type in trusted_content_types:
+def guess_content_type(
+    content: str | bytes, content_type: str = "", path: str = ""
+) -> str:
+    if content_type in TRUSTED_CONTENT_TYPES:
         return content_type
 
     if hasattr(content, "read"):
@@ -218,6 +222,7 @@ def guess_content_type(
     return content_type or "text/plain"
 
 
+@lru_cache(maxsize=64)
 def get_process_engine_from_type(type):
     if "image" in type:
         return "IMAGE"
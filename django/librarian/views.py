@@ -320,6 +320,8 @@ def modal_view(request, item_type=None, item_id=None, parent_id=None, documents=
             users_form = LibraryUsersForm(request.POST, library=selected_library)
             if users_form.is_valid():
                 users_form.save()
+                # The permission check on this view cached the user's old roles
+                clear_request_caches()
                 messages.success(request, _("Library users updated successfully."))
             else:
                 logger.error("Error updating library users:", errors=users_form.errors)
@@ -58,15 +58,28 @@ class User(AbstractBaseUser, PermissionsMixin):
     USERNAME_FIELD = "upn"
     REQUIRED_FIELDS = []
 
+    @property
+    def group_names(self):
+        # Loaded once per user instance. Shares the cache that otto.rules.group_member
+        # keeps on the user, so group checks in properties and predicates agree
+        if not hasattr(self, "_group_names_cache"):
+            self._group_names_cache = set(self.groups.values_list("name", flat=True))
+        return self._group_names_cache
+
+    def clear_group_cache(self):
+        # Also drops the group id cache kept by otto.rules
+        self.__dict__.pop("_group_names_cache", None)
+        self.__dict__.pop("_group_ids_cache", None)
+
     @property
     def is_admin(self):
         # Check if user is member of "Otto admin" group
-        return self.groups.filter(name="Otto admin").exists()
+        return "Otto admin" in self.group_names
 
     @property
     def is_operations_admin(self):
         # Check if user is member of "Operations admin" group or "Otto admin" group
-        return self.groups.filter(name__in=["Operations admin", "Otto admin"]).exists()
+        return not self.group_names.isdisjoint({"Operations admin", "Otto admin"})
 
     @property
     def accepted_terms(self):
@@ -123,6 +136,7 @@ class User(AbstractBaseUser, PermissionsMixin):
 
     def make_otto_admin(self):
         self.groups.add(Group.objects.get(name="Otto admin"))
+        self.clear_group_cache()
 
     # When user is deleted, their personal library should be also
     def delete(self, *args, **kwargs):
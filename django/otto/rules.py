@@ -6,7 +6,7 @@ See https://github.com/dfunckt/django-rules
 from django.conf import settings
 
 from data_fetcher import cache_within_request
-from rules import add_perm, is_group_member, predicate
+from rules import add_perm, predicate
 
 from chat.models import Chat
 from librarian.models import LibraryUserRole
@@ -28,11 +28,28 @@ def accepted_terms(user):
     return user.accepted_terms_date is not None
 
 
+def group_member(group_name):
+    """
+    Like rules.is_group_member, for a single group: a set lookup in the group
+    names cached on the user, without building a set of groups on every call.
+    """
+
+    @predicate(f"is_group_member:{group_name}")
+    def fn(user):
+        if not hasattr(user, "groups"):
+            return False
+        if not hasattr(user, "_group_names_cache"):
+            user._group_names_cache = set(user.groups.values_list("name", flat=True))
+        return group_name in user._group_names_cache
+
+    return fn
+
+
 # AC-16(2): Security Attribute Modification
-# "is_group_member" returns a predicate
-is_admin = is_group_member("Otto admin")
-is_operations_admin = is_group_member("Operations admin")
-is_data_steward = is_group_member("Data steward")
+# "group_member" returns a predicate
+is_admin = group_member("Otto admin")
+is_operations_admin = group_member("Operations admin")
+is_data_steward = group_member("Data steward")
 
 add_perm("otto.manage_users", is_admin)
 add_perm("otto.manage_banner", is_admin)
@@ -47,22 +64,26 @@ def can_enable_load_testing(user):
     return is_admin(user)
 
 
+# Check model attributes before group membership, which may need a query
 @predicate
 def can_view_app(user, app):
-    if is_admin(user):
-        return True
-    if settings.IS_PROD:
-        return app.visible_to_all or can_access_app(user, app)
     return app.visible_to_all or can_access_app(user, app)
 
 
+def _user_group_ids(user):
+    # Cached on the user instance, like the group names cache in group_member
+    if not hasattr(user, "_group_ids_cache"):
+        user._group_ids_cache = set(user.groups.values_list("id", flat=True))
+    return user._group_ids_cache
+
+
 @predicate
 def can_access_app(user, app):
     if is_admin(user):
         return True
-    if app.user_group is None:
+    if app.user_group_id is None:
         return False
-    return is_group_member(app.user_group.name)(user)
+    return app.user_group_id in _user_group_ids(user)
 
 
 @predicate
@@ -83,35 +104,41 @@ add_perm("otto.manage_cost_dashboard", can_access_cost_dashboard)
 
 
 # AI Assistant
+# Compare foreign key ids rather than related objects, so that checking a
+# permission does not fetch the owning user from the database
+def _is_owner(user, owner_id):
+    return owner_id is not None and owner_id == user.pk
+
+
 @predicate
 def can_access_chat(user, chat):
-    return chat.user == user
+    return _is_owner(user, chat.user_id)
 
 
 @predicate
 def can_access_message(user, message):
-    return message.chat.user == user
+    return _is_owner(user, message.chat.user_id)
 
 
 @predicate
 def can_access_file(user, file):
-    return file.message.chat.user == user
+    return _is_owner(user, file.message.chat.user_id)
 
 
 @predicate
 def can_access_preset(user, preset):
     return (
-        user == preset.owner
-        or user in preset.accessible_to.all()
+        _is_owner(user, preset.owner_id)
         or preset.sharing_option == "everyone"
+        or preset.accessible_to.filter(pk=user.pk).exists()
     )
 
 
 @predicate
 def can_edit_preset(user, preset):
-    if preset.owner is None:
+    if preset.owner_id is None:
         return is_admin(user)
-    return user == preset.owner
+    return _is_owner(user, preset.owner_id)
 
 
 @predicate
@@ -144,42 +171,37 @@ add_perm("chat.upload_large_files", can_upload_large_files)
 
 
 # Librarian
-# Ensures a simple query is used to get the roles for a user
+# Ensures a simple query is used to get the roles for a user.
+# Users have at most one role per library, so this maps library id -> role name.
+# Cached for the request; LibraryUserRole saves and deletes clear the cache (see
+# librarian.models), but writes that skip signals (bulk_create, update) must call
+# data_fetcher.util.clear_request_caches() themselves
 @cache_within_request
 def get_library_roles_for_user(user):
-    return list(LibraryUserRole.objects.filter(user=user))
+    return dict(
+        LibraryUserRole.objects.filter(user=user).values_list("library_id", "role")
+    )
 
 
 # Do all subsequent filtering on Python objects (in memory) instead of in the database
 @predicate
 def is_library_viewer(user, library):
-    return any(
-        role.library_id == library.id and role.role == "viewer"
-        for role in get_library_roles_for_user(user)
-    )
+    return get_library_roles_for_user(user).get(library.id) == "viewer"
 
 
 @predicate
 def is_library_contributor(user, library):
-    return any(
-        role.library_id == library.id and role.role == "contributor"
-        for role in get_library_roles_for_user(user)
-    )
+    return get_library_roles_for_user(user).get(library.id) == "contributor"
 
 
 @predicate
 def is_library_admin(user, library):
-    return any(
-        role.library_id == library.id and role.role == "admin"
-        for role in get_library_roles_for_user(user)
-    )
+    return get_library_roles_for_user(user).get(library.id) == "admin"
 
 
 @predicate
 def is_library_user(user, library):
-    return any(
-        role.library_id == library.id for role in get_library_roles_for_user(user)
-    )
+    return library.id in get_library_roles_for_user(user)
 
 
 @predicate
@@ -194,7 +216,7 @@ def can_change_publicity(user, library):
     if not library.id:
         return can_manage_public_libraries(user)
     return can_manage_public_libraries(user) and (
-        is_library_admin(user, library) or is_admin(user)
+        is_admin(user) or is_library_admin(user, library)
     )
 
 
@@ -65,6 +65,9 @@ class AccessControl(models.Model):
         action = "C" if not self.pk else "U"
         super().save(*args, **kwargs)
 
+        if not settings.SECURE_MODELS_AUDIT:
+            return
+
         # Given self.content_type and object_id, get the content_object
         content_object = self.content_type.get_object_for_this_type(pk=self.object_id)
 
@@ -83,20 +86,23 @@ class AccessControl(models.Model):
     @transaction.atomic
     def delete(self, reason, *args, **kwargs):
         # Log deletion before actual deletion
-        # Given self.content_type and object_id, get the content_object
-        content_object = self.content_type.get_object_for_this_type(pk=self.object_id)
+        if settings.SECURE_MODELS_AUDIT:
+            # Given self.content_type and object_id, get the content_object
+            content_object = self.content_type.get_object_for_this_type(
+                pk=self.object_id
+            )
 
-        AccessControlLog.objects.create(
-            upn=self.user.upn,
-            action="D",
-            can_view=self.can_view,
-            can_change=self.can_change,
-            can_delete=self.can_delete,
-            content_object=str(content_object),
-            reason=reason,
-            modified_by=self.modified_by.upn if self.modified_by else None,
-            modified_at=timezone.now(),
-        )
+            AccessControlLog.objects.create(
+                upn=self.user.upn,
+                action="D",
+                can_view=self.can_view,
+                can_change=self.can_change,
+                can_delete=self.can_delete,
+                content_object=str(content_object),
+                reason=reason,
+                modified_by=self.modified_by.upn if self.modified_by else None,
+                modified_at=timezone.now(),
+            )
 
         super().delete(*args, **kwargs)
 
@@ -161,6 +167,117 @@ class AccessControl(models.Model):
 
         return
 
+    @classmethod
+    @transaction.atomic
+    def grant_permissions_bulk(cls, grants, modified_by=None, reason=None):
+        """
+        Grant permissions for many (user, content_object, required_permissions)
+        at once, with the same semantics as grant_permissions but one upsert,
+        one log insert and one access_controls insert per model
+        AccessControl.grant_permissions_bulk(
+            [
+                (user1, app_instance, ['can_view']),
+                (user2, app_instance, ['can_view', 'can_change']),
+            ],
+            modified_by=current_user,
+            reason="Granting permissions"
+        )
+        """
+        grants = list(grants)
+        valid_permissions = set(cls.valid_permissions())
+        for user, content_object, required_permissions in grants:
+            if not required_permissions:
+                logger.error("At least one permission should be granted.")
+                raise ValueError("At least one permission should be granted.")
+            if not set(required_permissions).issubset(valid_permissions):
+                logger.error("Invalid permissions specified.")
+                raise ValueError("Invalid permissions specified.")
+
+        # A row can only be upserted once per statement; the last grant wins
+        grants = list(
+            {(grant[0].pk, grant[1].pk): grant for grant in grants}.values()
+        )
+        if not grants:
+            return []
+
+        audit = settings.SECURE_MODELS_AUDIT
+        if audit:
+            # The log tells creates from updates, so note which rows exist already
+            existing = set(
+                cls.objects.filter(
+                    user__in={user.pk for user, obj, perms in grants},
+                    object_id__in={obj.pk for user, obj, perms in grants},
+                ).values_list("user_id", "object_id")
+            )
+        access_controls = cls.objects.bulk_create(
+            [
+                cls(
+                    user=user,
+                    content_type=ContentType.objects.get_for_model(content_object),
+                    object_id=content_object.pk,
+                    modified_by=modified_by,
+                    reason=reason,
+                    **{
+                        permission: permission in required_permissions
+                        for permission in valid_permissions
+                    },
+                )
+                for user, content_object, required_permissions in grants
+            ],
+            update_conflicts=True,
+            unique_fields=["user", "object_id"],
+            update_fields=[
+                "content_type",
+                "modified_by",
+                "reason",
+                "modified_at",
+                *valid_permissions,
+            ],
+        )
+
+        if audit:
+            now = timezone.now()
+            AccessControlLog.objects.bulk_create(
+                [
+                    AccessControlLog(
+                        upn=user.upn,
+                        action=(
+                            "U" if (user.pk, content_object.pk) in existing else "C"
+                        ),
+                        can_view=access_control.can_view,
+                        can_change=access_control.can_change,
+                        can_delete=access_control.can_delete,
+                        content_object=str(content_object),
+                        reason=reason,
+                        modified_by=modified_by.upn if modified_by else None,
+                        modified_at=now,
+                    )
+                    for (user, content_object, perms), access_control in zip(
+                        grants, access_controls
+                    )
+                ]
+            )
+
+        # Update the many-to-many relationship in the content_objects, per model
+        links = {}
+        for (user, content_object, perms), access_control in zip(
+            grants, access_controls
+        ):
+            field = content_object._meta.get_field("access_controls")
+            through = field.remote_field.through
+            links.setdefault(through, []).append(
+                through(
+                    **{
+                        f"{field.m2m_field_name()}_id": content_object.pk,
+                        f"{field.m2m_reverse_field_name()}_id": access_control.pk,
+                    }
+                )
+            )
+        for through, rows in links.items():
+            through.objects.bulk_create(rows, ignore_conflicts=True)
+
+        return access_controls
+
     @classmethod
     @transaction.atomic
     def revoke_permissions(
@@ -245,6 +362,57 @@ class AccessControl(models.Model):
 
         return False
 
+    @classmethod
+    def _permission_flags(cls, user, content_object):
+        # The user's can_* columns for the object, or None without an AccessControl
+        return (
+            cls.objects.filter(
+                user=user,
+                content_type=ContentType.objects.get_for_model(content_object),
+                object_id=content_object.id,
+            )
+            .values(*cls.valid_permissions())
+            .first()
+        )
+
+    @classmethod
+    def check_permissions_bulk(cls, user, content_object, permission_lists):
+        """
+        Check several permission lists on one object with a single query
+        can_view, can_edit = AccessControl.check_permissions_bulk(
+            user, app_instance, [["can_view"], ["can_view", "can_change"]]
+        )
+        """
+
+        flags = cls._permission_flags(user, content_object)
+
+        if flags:
+            return [
+                all(flags[permission] for permission in required_permissions)
+                for required_permissions in permission_lists
+            ]
+
+        return [False] * len(permission_lists)
+
+    @classmethod
+    def get_permission_set(cls, user, content_object):
+        """
+        Get all of a user's permissions on an object with a single query
+        permissions = AccessControl.get_permission_set(user, app_instance)
+        if AccessControl.CAN_VIEW in permissions:
+            # User can view the object
+            pass
+        """
+
+        flags = cls._permission_flags(user, content_object)
+
+        if flags:
+            return frozenset(
+                permission for permission, granted in flags.items() if granted
+            )
+
+        return frozenset()
+
 
 class AccessControlLog(models.Model):
     ACTION_CHOICES = [
@@ -294,10 +462,11 @@ class SecureManager(models.Manager):
         return super().filter(query)
 
     def create(self, access_key: AccessKey, **kwargs):
-        # Create the instance with a new UUID
+        # Create the instance with a new UUID. The id is set by hand, so force an
+        # INSERT rather than letting save() try an UPDATE first
         kwargs["id"] = uuid.uuid4()
         instance = self.model(**kwargs)
-        instance.save(AccessKey(bypass=True))
+        instance.save(AccessKey(bypass=True), force_insert=True)
 
         # Grant ownership permissions to the creating user (unless bypassing)
         if not access_key.bypass:
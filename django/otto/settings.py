@@ -134,6 +134,14 @@ MIDDLEWARE = [
     "otto.utils.middleware.PreventConcurrentLoginsMiddleware",
 ]
 
+# Groups given to the auto-login test user when it is first created
+AUTO_LOGIN_GROUPS = [
+    "Otto admin",
+    "AI Assistant user",
+    "Legislation Search user",
+    "Text Extractor user",
+]
+
 # Configure authentication backends for both test and development environments
 # Rules backend is required for object-level permissions (e.g., chat access)
 AUTHENTICATION_BACKENDS = [
@@ -259,6 +267,16 @@ if os.environ.get("VECTORDB_ENGINE") is not None:
         DATABASES["vector_db"].update(pgbouncer_options)
 
 
+# FAST_TESTS=True runs the tests against an in-memory SQLite database instead of
+# the configured one. Django's SQLite backend enforces foreign keys already.
+if IS_RUNNING_TESTS and os.environ.get("FAST_TESTS", "False") == "True":
+    DATABASES["default"] = {
+        "ENGINE": "django.db.backends.sqlite3",
+        "NAME": ":memory:",
+        "TEST": {"NAME": ":memory:"},
+    }
+
+
 # Password validation
 # https://docs.djangoproject.com/en/4.1/ref/settings/#auth-password-validators
 
@@ -375,6 +393,11 @@ CELERY_ACCEPT_CONTENT = ["application/json"]
 CELERY_TASK_SERIALIZER = "json"
 CELERY_RESULT_SERIALIZER = "json"
 CELERY_TIMEZONE = "UTC"
+# Tasks like translate_file and extract_text_task can run for up to 10 minutes.
+# Only reserve one task at a time so that queued tasks aren't stuck behind a long
+# one on a busy worker. Late acknowledgement is set per task, only on tasks that
+# are safe to run twice.
+CELERY_WORKER_PREFETCH_MULTIPLIER = 1
 
 if IS_RUNNING_TESTS:
     CELERY_TASK_ALWAYS_EAGER = True
@@ -390,6 +413,11 @@ CACHES = {
     }
 }
 
+if IS_RUNNING_TESTS:
+    # Parallel pytest-xdist workers each get their own database; keep their
+    # cached values apart too
+    CACHES["default"]["KEY_PREFIX"] += os.environ.get("PYTEST_XDIST_WORKER", "")
+
 
 DATA_UPLOAD_MAX_NUMBER_FIELDS = 10000
 DATA_UPLOAD_MAX_NUMBER_FILES = 2000
@@ -465,6 +493,9 @@ structlog.configure(
     cache_logger_on_first_use=True,
 )
 
+# AU-2: Record every change to an AccessControl in the AccessControlLog
+SECURE_MODELS_AUDIT = True
+
 ALLOWED_FETCH_URLS = [
     "canada.ca",
     "gc.ca",
@@ -20,14 +20,12 @@ def file_size_to_string(filesize):
 
 
 def display_cad_cost(usd_cost):
-    from django.utils.translation import get_language
-
-    from otto.models import OttoStatus  # Need to do it here to avoid circular imports
-
     """
     Converts a USD cost to CAD and returns a formatted string
     """
-    approx_cost_cad = float(usd_cost) * OttoStatus.objects.singleton().exchange_rate
+    from django.utils.translation import get_language
+
+    approx_cost_cad = cad_cost(usd_cost)
     is_fr = (get_language() or "").lower().startswith("fr")
     if approx_cost_cad < 0.01:
         # For tiny amounts, keep the threshold text but position the $ per locale
@@ -36,14 +34,16 @@ def display_cad_cost(usd_cost):
     return f"{approx_cost_cad:.2f}$" if is_fr else f"${approx_cost_cad:.2f}"
 
 
-def cad_cost(usd_cost):
-    from otto.models import OttoStatus  # Need to do it here to avoid circular imports
-
+def cad_cost(usd_cost, exchange_rate=None):
     """
-    Converts a USD cost to CAD and returns a float
+    Converts a USD cost to CAD and returns a float.
+    Uses the current OttoStatus exchange rate unless one is given.
     """
-    approx_cost_cad = float(usd_cost) * OttoStatus.objects.singleton().exchange_rate
-    return approx_cost_cad
+    if exchange_rate is None:
+        from otto.models import OttoStatus  # Avoid circular imports
+
+        exchange_rate = OttoStatus.objects.singleton().exchange_rate
+    return float(usd_cost) * exchange_rate
 
 
 def set_costs(object):
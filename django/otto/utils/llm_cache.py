@@ -0,0 +1,70 @@
+import hashlib
+import json
+
+from django.core.cache import cache
+
+from llama_index.core.llms import MockLLM
+from structlog import get_logger
+
+logger = get_logger(__name__)
+
+seven_days = 60 * 60 * 24 * 7
+
+
+class LLMCache:
+    """
+    Exact-match cache for LLM completions, backed by the Django cache.
+    Only deterministic calls (temperature 0) to a real model are cached, so a
+    cached response is always one the model would have returned anyway.
+    """
+
+    def __init__(self, timeout: int = seven_days) -> None:
+        self.timeout = timeout
+
+    @staticmethod
+    def is_cacheable(llm) -> bool:
+        # MockLLM output (mock_llm context, or no GEMINI_API_KEY) must never be
+        # served later as a real response
+        if getattr(llm, "use_mock_llm", False) or isinstance(
+            getattr(llm, "llm", None), MockLLM
+        ):
+            return False
+        return llm.temperature == 0
+
+    @staticmethod
+    def make_key(model: str, prompt: str, system_prompt: str | None = None) -> str:
+        payload = json.dumps(
+            {"model": model, "prompt": prompt, "system_prompt": system_prompt},
+            sort_keys=True,
+        )
+        return f"llm_response_{hashlib.sha256(payload.encode('utf-8')).hexdigest()}"
+
+    def get(self, model: str, prompt: str, system_prompt: str | None = None):
+        return cache.get(self.make_key(model, prompt, system_prompt))
+
+    def set(
+        self, model: str, prompt: str, response: str, system_prompt: str | None = None
+    ) -> None:
+        cache.set(self.make_key(model, prompt, system_prompt), response, self.timeout)
+
+    def complete(self, llm, prompt: str) -> str:
+        """
+        Return llm.complete(prompt), served from the cache when the call is
+        deterministic. Cached responses incur no token costs.
+        """
+        if not self.is_cacheable(llm):
+            return llm.complete(prompt)
+
+        system_prompt = getattr(llm, "system_prompt", None)
+        response = self.get(llm.deployment, prompt, system_prompt)
+        if response is not None:
+            logger.debug("LLM cache hit", deployment=llm.deployment)
+            return response
+
+        logger.debug("LLM cache miss", deployment=llm.deployment)
+        response = llm.complete(prompt)
+        self.set(llm.deployment, prompt, response, system_prompt)
+        return response
+
+
+llm_cache = LLMCache()
@@ -1,45 +1,159 @@
 import json
 import os
+import re
+from concurrent.futures import ThreadPoolExecutor
 
 import polib
 from structlog import get_logger
 
+from otto.utils.llm_cache import llm_cache
+
 logger = get_logger(__name__)
 
+# Matches a numbered, JSON-encoded line in a batch translation response, e.g. 3. "Bonjour"
+_NUMBERED_LINE = re.compile(r'^\s*(\d+)\.\s*(".*")\s*$')
+
+# Sent as the system prompt of every translation request so that Gemini sees an
+# identical prefix across calls; only the text to translate varies
+TRANSLATION_SYSTEM_PROMPT = "Translate the following text to Canadian French (fr-ca):"
+
+# Fixed instructions preceding the numbered strings in every batch request, so
+# that only the numbered strings vary between requests
+BATCH_PROMPT_PREFIX = (
+    "Translate each of the following numbered strings. "
+    "Each string is JSON-encoded. Respond with only the translated strings, "
+    "one per line, using the same numbering and JSON encoding:\n\n"
+)
+
+# Maximum number of batch translation requests in flight at once
+TRANSLATION_MAX_CONCURRENCY = 8
+
+
+def needs_translation(text: str) -> bool:
+    """
+    Strings without any letters (e.g. "%s", ":", "—", numbers) or a single
+    character long are the same in French, so they are not sent to Gemini.
+    """
+    return len(text) >= 2 and any(c.isalpha() for c in text)
+
 
 class LocaleTranslator:
 
     def __init__(self) -> None:
         """Initialize LocaleTranslator with Gemini API."""
-        pass
+        self._llm = None
+
+    @staticmethod
+    def _new_llm():
+        from chat.llm import OttoLLM
+
+        return OttoLLM(
+            deployment="gemini-1.5-flash",
+            temperature=0,
+            system_prompt=TRANSLATION_SYSTEM_PROMPT,
+        )
 
     def update_translations(self, locale_dir) -> None:
 
         translations_file = os.path.join(locale_dir, "translation", "translations.json")
         translations = self.__load_translations(translations_file)
 
-        self.__update_po_file(locale_dir, translations)
+        # One LLM is shared by the whole PO file so that costs are recorded once
+        self._llm = self._new_llm()
+        try:
+            self.__update_po_file(locale_dir, translations)
+        finally:
+            self._llm.create_costs()
+            self._llm = None
 
         self.__save_translations(translations_file, translations)
 
-    def translate_text(self, text: str) -> str:
+    def translate_text(self, text: str, llm=None) -> str:
         """Translate text using Gemini API."""
-        from chat.llm import OttoLLM
-
-        llm = OttoLLM(deployment="gemini-1.5-flash")
-        prompt = f"Translate the following text to Canadian French (fr-ca):\n\n{text}"
-        translation = llm.complete(prompt)
-        llm.create_costs()
+        if not needs_translation(text):
+            return text
+
+        owns_llm = llm is None
+        if owns_llm:
+            llm = self._new_llm()
+        translation = llm_cache.complete(llm, text)
+        if owns_llm:
+            llm.create_costs()
         return translation
 
+    def translate_batch(
+        self, texts: list[str], batch_size: int = 32, llm=None
+    ) -> list[str]:
+        """
+        Translate a list of strings using Gemini API, sending batch_size strings per
+        request with up to TRANSLATION_MAX_CONCURRENCY requests in parallel. Falls
+        back to one request per string if a batch response can't be parsed.
+        Returns the translations in the same order as texts.
+        Costs are only recorded here if no llm is passed in.
+        """
+        if not texts:
+            return []
+
+        owns_llm = llm is None
+        if owns_llm:
+            llm = self._new_llm()
+        batches = [texts[i : i + batch_size] for i in range(0, len(texts), batch_size)]
+        with ThreadPoolExecutor(max_workers=TRANSLATION_MAX_CONCURRENCY) as executor:
+            batch_translations = list(
+                executor.map(
+                    lambda batch: self.__translate_numbered_batch(batch, llm), batches
+                )
+            )
+        if owns_llm:
+            llm.create_costs()
+        return [
+            translation
+            for translations in batch_translations
+            for translation in translations
+        ]
+
+    def __translate_numbered_batch(self, batch, llm):
+        # Strings are JSON-encoded so that multi-line msgids stay on a single line
+        numbered_lines = "\n".join(
+            f"{i}. {json.dumps(text, ensure_ascii=False)}"
+            for i, text in enumerate(batch, start=1)
+        )
+        response = llm_cache.complete(llm, BATCH_PROMPT_PREFIX + numbered_lines)
+
+        parsed = {}
+        for line in response.splitlines():
+            match = _NUMBERED_LINE.match(line)
+            if not match:
+                continue
+            try:
+                parsed[int(match.group(1))] = json.loads(match.group(2))
+            except json.JSONDecodeError:
+                continue
+
+        if set(parsed) != set(range(1, len(batch) + 1)):
+            logger.debug(
+                f"Could not parse batch translation response; "
+                f"translating {len(batch)} entries individually."
+            )
+            return [self.translate_text(text, llm=llm) for text in batch]
+
+        return [parsed[i] for i in range(1, len(batch) + 1)]
+
     def __load_translations(self, translations_file):
         with open(translations_file, "r", encoding="utf-8") as json_file:
             translations = json.load(json_file)
         return translations
 
     def __save_translations(self, translations_file, translations):
+        serialized = json.dumps(translations, ensure_ascii=False, indent=4)
+        # Avoid rewriting the file when nothing changed
+        if os.path.exists(translations_file):
+            with open(translations_file, "r", encoding="utf-8") as json_file:
+                if json_file.read() == serialized:
+                    logger.debug(f"No changes to file at path: {translations_file}.")
+                    return
         with open(translations_file, "w", encoding="utf-8") as json_file:
-            json.dump(translations, json_file, ensure_ascii=False, indent=4)
+            json_file.write(serialized)
 
     def __update_po_file(self, dir, translations_reference):
         po_file_path = os.path.join(dir, "fr", "LC_MESSAGES", "django.po")
@@ -48,6 +162,10 @@ class LocaleTranslator:
         valid_entries = [entry for entry in po_file if not entry.obsolete]
         logger.debug(f"Loaded {len(valid_entries)} entries.")
 
+        # Entries needing a new machine translation are collected and translated in batches
+        pending_entries = []
+        # The PO file is only rewritten if at least one msgstr actually changed
+        dirty = False
         for entry in valid_entries:
             translation_id = entry.msgid
             fr = ""
@@ -73,20 +191,38 @@ class LocaleTranslator:
                         f'Machine translation entry for "{translation_id}" already exists.'
                     )
                 else:
-                    fr = ""
-                    fr_auto = self.translate_text(translation_id)
+                    pending_entries.append(entry)
                     logger.debug(f'Translating "{translation_id}."')
+                    continue
             else:
-                fr = ""
-                fr_auto = (
-                    entry.msgstr
-                    if entry.msgstr
-                    else self.translate_text(translation_id)
-                )
                 logger.debug(f'Creating and translating entry "{translation_id}".')
+                if not entry.msgstr:
+                    pending_entries.append(entry)
+                    continue
+                fr = ""
+                fr_auto = entry.msgstr
 
             translations_reference[translation_id] = {"fr": fr, "fr_auto": fr_auto}
-            entry.msgstr = fr if fr else fr_auto
+            msgstr = fr if fr else fr_auto
+            if entry.msgstr != msgstr:
+                entry.msgstr = msgstr
+                dirty = True
+
+        to_translate = [e.msgid for e in pending_entries if needs_translation(e.msgid)]
+        machine_translations = dict(
+            zip(to_translate, self.translate_batch(to_translate, llm=self._llm))
+        )
+        for entry in pending_entries:
+            # Untranslatable entries keep their msgid without a call to Gemini
+            fr_auto = machine_translations.get(entry.msgid, entry.msgid)
+            translations_reference[entry.msgid] = {"fr": "", "fr_auto": fr_auto}
+            if entry.msgstr != fr_auto:
+                entry.msgstr = fr_auto
+                dirty = True
+
+        if not dirty:
+            logger.debug(f"No changes to file at path: {po_file_path}.")
+            return
 
         logger.debug(f"Updating file at path: {po_file_path}.")
         po_file.save(po_file_path)
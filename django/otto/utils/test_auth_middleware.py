@@ -1,6 +1,7 @@
 # TEMPORARY: Auto-login middleware for local testing
 # WARNING: Remove this file and middleware configuration before production deployment!
 
+from django.conf import settings
 from django.contrib.auth import get_user_model, login
 from django.utils.deprecation import MiddlewareMixin
 from structlog import get_logger
@@ -8,6 +9,10 @@ from structlog import get_logger
 logger = get_logger(__name__)
 User = get_user_model()
 
+# Primary key of the test user once it has been resolved, so that later requests
+# only need a single primary key lookup
+_TEST_USER_ID = None
+
 
 class AutoLoginMiddleware(MiddlewareMixin):
     """
@@ -16,42 +21,59 @@ class AutoLoginMiddleware(MiddlewareMixin):
     WARNING: This is ONLY for local testing and must be removed before production!
     """
 
+    def get_test_user(self):
+        """
+        Returns (test_user, created), creating the test user on first use
+        """
+        global _TEST_USER_ID
+
+        if _TEST_USER_ID is not None:
+            test_user = User.objects.filter(pk=_TEST_USER_ID).first()
+            if test_user is not None:
+                return test_user, False
+
+        test_user, created = User.objects.get_or_create(
+            upn="testuser",
+            defaults={
+                "email": "test@example.com",
+                "first_name": "Test",
+                "last_name": "User",
+                "is_active": True,
+                "is_staff": False,
+                "homepage_tour_completed": True,
+                "ai_assistant_tour_completed": True,
+                "laws_search_tour_completed": True,
+            },
+        )
+        _TEST_USER_ID = test_user.pk
+        return test_user, created
+
     def process_request(self, request):
         if not request.user.is_authenticated:
             try:
                 # Get or create test user
-                test_user, created = User.objects.get_or_create(
-                    upn="testuser",
-                    defaults={
-                        "email": "test@example.com",
-                        "first_name": "Test",
-                        "last_name": "User",
-                        "is_active": True,
-                        "is_staff": False,
-                        "homepage_tour_completed": True,
-                        "ai_assistant_tour_completed": True,
-                        "laws_search_tour_completed": True,
-                    },
-                )
+                test_user, created = self.get_test_user()
 
                 # Add testuser to groups for full access in debug mode
                 if created:
                     from django.contrib.auth.models import Group
 
-                    # Add to Otto admin group for admin permissions
-                    admin_group, _ = Group.objects.get_or_create(name="Otto admin")
-                    test_user.groups.add(admin_group)
-
-                    # Add to AI Assistant user group for chat access
-                    ai_group, _ = Group.objects.get_or_create(name="AI Assistant user")
-                    test_user.groups.add(ai_group)
-
-                    # Add to other app user groups
-                    laws_group, _ = Group.objects.get_or_create(name="Legislation Search user")
-                    test_user.groups.add(laws_group)
-
-                    text_extractor_group, _ = Group.objects.get_or_create(name="Text Extractor user")
-                    test_user.groups.add(text_extractor_group)
+                    # Create any missing groups in one INSERT, then add them all at once
+                    existing = set(
+                        Group.objects.filter(
+                            name__in=settings.AUTO_LOGIN_GROUPS
+                        ).values_list("name", flat=True)
+                    )
+                    Group.objects.bulk_create(
+                        [
+                            Group(name=name)
+                            for name in settings.AUTO_LOGIN_GROUPS
+                            if name not in existing
+                        ],
+                        ignore_conflicts=True,
+                    )
+                    groups = Group.objects.filter(name__in=settings.AUTO_LOGIN_GROUPS)
+                    test_user.groups.add(*groups)
 
                 # Log in the test user
                 login(request, test_user, backend="django.contrib.auth.backends.ModelBackend")
@@ -1,5 +1,7 @@
+import io
 import os
 import tempfile
+from concurrent.futures import ThreadPoolExecutor
 from decimal import Decimal
 from unittest import mock
 
@@ -10,7 +12,12 @@ import pytest_asyncio
 
 from chat._views.load_test import exhaust_streaming_response
 from chat.models import Chat, Message
-from chat.tasks import translate_file
+from chat.tasks import (
+    _map_bounded,
+    _read_paragraph_chunks,
+    _translate_chunk,
+    translate_file,
+)
 
 pytest_plugins = ("pytest_asyncio",)
 
@@ -59,6 +66,51 @@ def test_translate_file(all_apps_user):
             os.remove(file_path)
 
 
+def test_read_paragraph_chunks():
+    """Test that documents are split on paragraph boundaries without losing text."""
+    paragraphs = [f"Paragraph {i} " + "word " * 20 + "\n\n" for i in range(20)]
+    text = "".join(paragraphs)
+
+    chunks = list(_read_paragraph_chunks(io.StringIO(text), max_tokens=100))
+
+    assert len(chunks) > 1
+    assert "".join(chunks) == text
+    # Every chunk except the last should end on a paragraph boundary
+    assert all(chunk.endswith("\n\n") for chunk in chunks[:-1])
+
+    # Short documents are sent as a single chunk
+    assert list(_read_paragraph_chunks(io.StringIO("Hello"))) == ["Hello"]
+
+
+def test_translate_chunk_keeps_layout():
+    """Test that translated chunks keep their original surrounding whitespace."""
+    llm = mock.MagicMock()
+    llm.complete.side_effect = lambda text: f" {text.upper()}\n"
+    chunks = ["    Indented paragraph\n\n\n", "hard split line\n", "last line"]
+
+    translated = "".join(_translate_chunk(llm, chunk) for chunk in chunks)
+
+    assert translated == "    INDENTED PARAGRAPH\n\n\nHARD SPLIT LINE\nLAST LINE"
+    assert _translate_chunk(llm, "\n\n") == "\n\n"
+    assert llm.complete.call_count == 3
+
+
+def test_map_bounded():
+    """Test that only a window of items is read ahead, and results keep order."""
+    consumed = []
+
+    def items():
+        for i in range(10):
+            consumed.append(i)
+            yield i
+
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        results = _map_bounded(executor, lambda i: i * 2, items(), window=2)
+        assert next(results) == 0
+        assert len(consumed) == 3
+        assert list(results) == [i * 2 for i in range(1, 10)]
+
+
 @pytest.mark.django_db(transaction=True)
 def test_translate_text_with_gemini(client, all_apps_user):
     """Test Gemini text translation through the translate_response function."""
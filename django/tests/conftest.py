@@ -87,8 +87,10 @@ def safe_rmtree(path, retries=5, delay=0.1):
 
 @pytest.fixture(scope="function", autouse=True)
 def set_test_media():
-    # Define the test media directory
-    test_media_dir = os.path.join(settings.BASE_DIR, "test_media")
+    # Define the test media directory (one per pytest-xdist worker, if any)
+    test_media_dir = os.path.join(
+        settings.BASE_DIR, "test_media", os.environ.get("PYTEST_XDIST_WORKER", "")
+    )
 
     storages = settings.STORAGES.copy()
     storages["default"]["LOCATION"] = test_media_dir
@@ -195,6 +197,91 @@ def basic_user(db, django_user_model):
     return new_user
 
 
+@pytest.fixture(autouse=True)
+def skip_personal_library(request, monkeypatch):
+    # Users created in tests marked no_personal_library get no personal library
+    if request.node.get_closest_marker("no_personal_library"):
+        from otto.models import User
+
+        monkeypatch.setattr(User, "create_personal_library", lambda self: None)
+
+
+@pytest.fixture(autouse=True)
+def no_audit_log(request):
+    # AccessControlLog rows are only written for tests marked audit_log
+    if request.node.get_closest_marker("audit_log"):
+        yield
+        return
+
+    with override_settings(SECURE_MODELS_AUDIT=False):
+        yield
+
+
+@pytest.fixture()
+def user_pool(db, django_user_model):
+    """
+    Create several users in a single INSERT, returned as a dict keyed by username.
+    Unlike basic_user, this skips create_user and so no personal libraries are made.
+    """
+
+    def new_users(*usernames, accept_terms=False):
+        users = django_user_model.objects.bulk_create(
+            [
+                django_user_model(
+                    upn=f"{username}.lastname@example.com",
+                    oid=f"{username}_oid",
+                    email=f"{username}@example.com",
+                    accepted_terms_date=datetime.now() if accept_terms else None,
+                )
+                for username in usernames
+            ]
+        )
+        return dict(zip(usernames, users))
+
+    return new_users
+
+
+@pytest.fixture()
+def chat_options(db):
+    # Presets require an options row, for tests that don't care about its contents
+    from chat.models import ChatOptions
+
+    return ChatOptions.objects.create()
+
+
+@pytest.fixture()
+def user_request(db):
+    # A SecureModel instance with no access controls, for secure_models tests
+    from otto.secure_models import AccessKey
+    from text_extractor.models import UserRequest
+
+    return UserRequest.objects.create(
+        access_key=AccessKey(bypass=True), name="Test Library"
+    )
+
+
+# Groups are deleted and recreated from groups.yaml by reset_app_data in
+# django_db_setup before each test, so these are function-scoped
+@pytest.fixture()
+def operations_admin_group(db):
+    return Group.objects.get(name="Operations admin")
+
+
+@pytest.fixture()
+def data_steward_group(db):
+    return Group.objects.get(name="Data steward")
+
+
+@pytest.fixture()
+def restricted_group(db):
+    return Group.objects.create(name="Restricted Group")
+
+
+@pytest.fixture()
+def special_group(db):
+    return Group.objects.create(name="Special Group")
+
+
 @pytest.fixture
 def mock_pdf_file():
     filename = "temp_file1.pdf"
@@ -414,7 +501,11 @@ def sample_pdf():
 
 
 @pytest.fixture(autouse=True)
-def ensure_otto_admin_group(db):
+def ensure_otto_admin_group(request):
+    # Tests marked no_db get no database access, and skip the app data reset
+    if request.node.get_closest_marker("no_db"):
+        return
+    request.getfixturevalue("db")
     Group.objects.get_or_create(name="Otto admin")
 
 @pytest.fixture(autouse=True)
@@ -456,6 +456,29 @@ def test_modal_views(client, all_apps_user):
     assert not LibraryUserRole.objects.filter(id=role.id).exists()
 
 
+@pytest.mark.django_db
+def test_library_admin_demoting_self_loses_users_form(client, basic_user):
+    from librarian.models import LibraryUserRole
+
+    user = basic_user(accept_terms=True)
+    user.groups.add(Group.objects.get(name="AI Assistant user"))
+    other_admin = basic_user(username="other_admin")
+    library = Library.objects.create(name_en="Test Library")
+    LibraryUserRole.objects.create(user=user, library=library, role="admin")
+    LibraryUserRole.objects.create(user=other_admin, library=library, role="admin")
+    client.force_login(user)
+
+    url = reverse(
+        "librarian:modal_manage_library_users", kwargs={"library_id": library.id}
+    )
+    response = client.post(url, {"admins": [other_admin.id], "viewers": [user.id]})
+
+    assert response.status_code == 200
+    assert LibraryUserRole.objects.get(user=user, library=library).role == "viewer"
+    # No longer a library admin, so the user management form is gone
+    assert response.context["users_form"] is None
+
+
 @pytest.mark.django_db
 def test_poll_status(client, all_apps_user):
     library = Library.objects.get_default_library()
@@ -1,7 +1,6 @@
 import pytest
 from django.contrib.auth import get_user_model
 from librarian.models import Library, DataSource
-from otto.models import SecurityLabel
 from chat.models import Chat, ChatOptions, Preset
 
 User = get_user_model()
@@ -19,8 +18,7 @@ def test_create_data_source():
     """
     Tests the creation of a DataSource object.
     """
-    # Use get_or_create to avoid duplicate key errors with fixtures
-    SecurityLabel.objects.get_or_create(name="Unclassified", defaults={"acronym_en": "UC"})
+    # Security labels and presets are seeded once by django_db_setup (reset_app_data)
     user = User.objects.create_user(upn="testuser@example.com", email="testuser@example.com")
     # Create chat which should automatically create associated DataSource
     chat = Chat.objects.create(user=user)
@@ -22,8 +22,9 @@ from django.http import HttpRequest
 from django.test import RequestFactory
 from django.urls import reverse
 
-from otto.models import User, App, Cost, CostType
+from otto.models import App, Cost, User
 from otto.rules import (
+    ADMINISTRATIVE_PERMISSIONS,
     accepted_terms,
     is_admin,
     can_view_app,
@@ -37,19 +38,42 @@ from otto.rules import (
     can_manage_library_users
 )
 from otto.utils.decorators import permission_required, app_access_required, budget_required
-from chat.models import Chat, ChatOptions, Preset
+from chat.models import Chat, Preset
 from librarian.models import Library, LibraryUserRole
 
+FIFTEEN_USD = Decimal("15.0")
+FIFTY_USD = Decimal("50.0")
+
+
+def clear_perm_cache(user):
+    """
+    Drop the group and permission caches that rules and ModelBackend keep on the
+    user instance, so changed memberships are seen without re-fetching the user
+    """
+    for attr in (
+        "_group_names_cache",
+        "_group_ids_cache",
+        "_group_perm_cache",
+        "_user_perm_cache",
+        "_perm_cache",
+    ):
+        user.__dict__.pop(attr, None)
+
 
 # ==================== Authentication Tests ====================
 
 @pytest.mark.django_db
+@pytest.mark.xdist_group(name="auth_TestUserAuthentication")
 class TestUserAuthentication:
     """Test user authentication and session management"""
 
-    def test_user_creation_with_upn(self, django_user_model):
-        """Test creating user with User Principal Name"""
-        user = django_user_model.objects.create_user(
+    @pytest.mark.parametrize(
+        "method,is_admin_user",
+        [("create_user", False), ("create_superuser", True)],
+    )
+    def test_user_creation(self, django_user_model, method, is_admin_user):
+        """Test creating users and superusers, identified by User Principal Name"""
+        user = getattr(django_user_model.objects, method)(
             upn="test.user@justice.gc.ca",
             email="test.user@justice.gc.ca",
             first_name="Test",
@@ -59,47 +83,25 @@ class TestUserAuthentication:
         assert user.upn == "test.user@justice.gc.ca"
         assert user.email == "test.user@justice.gc.ca"
         assert user.is_active is True
-        assert user.is_staff is False
-
-    def test_user_authentication_with_upn(self, django_user_model):
-        """Test that UPN is used as USERNAME_FIELD"""
-        user = django_user_model.objects.create_user(
-            upn="auth.test@justice.gc.ca",
-            email="auth.test@justice.gc.ca"
-        )
+        assert user.is_staff is is_admin_user
+        assert user.is_superuser is is_admin_user
 
         # Verify UPN is the username field
         assert user.USERNAME_FIELD == "upn"
-        assert user.get_username() == "auth.test@justice.gc.ca"
-
-    def test_user_personal_library_creation(self, django_user_model):
-        """Test that personal library is created on user creation"""
-        user = django_user_model.objects.create_user(
-            upn="library.user@justice.gc.ca",
-            email="library.user@justice.gc.ca",
-            first_name="Library",
-            last_name="User"
-        )
+        assert user.get_username() == "test.user@justice.gc.ca"
 
+        # Personal library is created on user creation
         personal_lib = user.personal_library
         assert personal_lib is not None
         assert personal_lib.is_personal_library is True
         assert personal_lib.created_by == user
 
-    def test_superuser_creation(self, django_user_model):
-        """Test creating superuser"""
-        superuser = django_user_model.objects.create_superuser(
-            upn="super.user@justice.gc.ca",
-            email="super.user@justice.gc.ca"
-        )
-
-        assert superuser.is_staff is True
-        assert superuser.is_superuser is True
-
 
 # ==================== Terms Acceptance Tests ====================
 
 @pytest.mark.django_db
+@pytest.mark.no_personal_library
+@pytest.mark.xdist_group(name="auth_TestTermsAcceptance")
 class TestTermsAcceptance:
     """Test terms and conditions acceptance workflow"""
 
@@ -131,6 +133,8 @@ class TestTermsAcceptance:
 # ==================== Group-Based Authorization Tests ====================
 
 @pytest.mark.django_db
+@pytest.mark.no_personal_library
+@pytest.mark.xdist_group(name="auth_TestGroupBasedAuthorization")
 class TestGroupBasedAuthorization:
     """Test role-based authorization using Django groups"""
 
@@ -145,36 +149,43 @@ class TestGroupBasedAuthorization:
 
         # Add to admin group
         user.groups.add(admin_group)
-        user = User.objects.get(pk=user.pk)  # Get fresh instance to clear caches
+        clear_perm_cache(user)
 
         assert user.is_admin
         assert is_admin(user)
 
-    def test_operations_admin_group(self, basic_user):
+    def test_group_predicates_for_anonymous_user(self):
+        """Test group predicates deny anonymous users"""
+        from django.contrib.auth.models import AnonymousUser
+
+        assert not is_admin(AnonymousUser())
+        assert not AnonymousUser().has_perm("otto.manage_users")
+
+    def test_operations_admin_group(self, basic_user, operations_admin_group):
         """Test Operations admin group membership"""
         user = basic_user()
-        ops_group, _ = Group.objects.get_or_create(name="Operations admin")
+        ops_group = operations_admin_group
 
         # Not operations admin initially
         assert not user.is_operations_admin
 
         # Add to operations admin group
         user.groups.add(ops_group)
-        user.refresh_from_db()
+        clear_perm_cache(user)
 
         assert user.is_operations_admin
 
-    def test_data_steward_permissions(self, basic_user):
+    def test_data_steward_permissions(self, basic_user, data_steward_group):
         """Test Data steward group permissions"""
         user = basic_user()
-        steward_group, _ = Group.objects.get_or_create(name="Data steward")
+        steward_group = data_steward_group
 
         # Initially cannot manage public libraries
         assert not user.has_perm("librarian.manage_public_libraries")
 
         # Add to data steward group
         user.groups.add(steward_group)
-        user = User.objects.get(pk=user.pk)  # Get fresh instance to clear caches
+        clear_perm_cache(user)
 
         assert user.has_perm("librarian.manage_public_libraries")
 
@@ -185,7 +196,7 @@ class TestGroupBasedAuthorization:
         assert not user.is_admin
 
         user.make_otto_admin()
-        user.refresh_from_db()
+        clear_perm_cache(user)
         assert user.is_admin
         assert user.has_perm("otto.manage_users")
         assert user.has_perm("otto.load_laws")
@@ -194,6 +205,8 @@ class TestGroupBasedAuthorization:
 # ==================== App Access Authorization Tests ====================
 
 @pytest.mark.django_db
+@pytest.mark.no_personal_library
+@pytest.mark.xdist_group(name="auth_TestAppAccessAuthorization")
 class TestAppAccessAuthorization:
     """Test app-level access control"""
 
@@ -209,10 +222,9 @@ class TestAppAccessAuthorization:
         assert can_view_app(user, app)
         assert user.has_perm("otto.view_app", app)
 
-    def test_view_app_restricted_no_group(self, basic_user):
+    def test_view_app_restricted_no_group(self, basic_user, restricted_group):
         """Test viewing restricted app without group membership"""
         user = basic_user()
-        restricted_group, _ = Group.objects.get_or_create(name="Restricted Group")
         app = App.objects.create(
             name="Restricted App",
             visible_to_all=False,
@@ -222,10 +234,9 @@ class TestAppAccessAuthorization:
         assert not can_view_app(user, app)
         assert not user.has_perm("otto.view_app", app)
 
-    def test_view_app_restricted_with_group(self, basic_user):
+    def test_view_app_restricted_with_group(self, basic_user, restricted_group):
         """Test viewing restricted app with group membership"""
         user = basic_user()
-        restricted_group, _ = Group.objects.get_or_create(name="Restricted Group")
         app = App.objects.create(
             name="Restricted App",
             visible_to_all=False,
@@ -239,14 +250,30 @@ class TestAppAccessAuthorization:
         assert can_view_app(user, app)
         assert user.has_perm("otto.view_app", app)
 
-    def test_admin_can_view_all_apps(self, all_apps_user):
+    def test_app_access_caches_group_ids(
+        self, basic_user, restricted_group, django_assert_num_queries
+    ):
+        """Test repeated app checks reuse the user's cached groups"""
+        user = basic_user()
+        user.groups.add(restricted_group)
+        app = App.objects.create(
+            name="Restricted App",
+            visible_to_all=False,
+            user_group=restricted_group
+        )
+
+        assert can_access_app(user, app)
+        with django_assert_num_queries(0):
+            assert can_access_app(user, app)
+            assert can_view_app(user, app)
+
+    def test_admin_can_view_all_apps(self, all_apps_user, special_group):
         """Test that admin users can view all apps"""
         admin = all_apps_user()
-        restricted_group, _ = Group.objects.get_or_create(name="Special Group")
         app = App.objects.create(
             name="Special App",
             visible_to_all=False,
-            user_group=restricted_group
+            user_group=special_group
         )
 
         # Admin not in special group but can still view
@@ -257,6 +284,8 @@ class TestAppAccessAuthorization:
 # ==================== Chat Access Authorization Tests ====================
 
 @pytest.mark.django_db
+@pytest.mark.no_personal_library
+@pytest.mark.xdist_group(name="auth_TestChatAccessAuthorization")
 class TestChatAccessAuthorization:
     """Test chat-level access control"""
 
@@ -268,42 +297,51 @@ class TestChatAccessAuthorization:
         assert can_access_chat(user, chat)
         assert user.has_perm("chat.access_chat", chat)
 
-    def test_user_cannot_access_other_chat(self, basic_user):
+    def test_chat_access_check_does_not_query(
+        self, basic_user, django_assert_num_queries
+    ):
+        """Test chat ownership is checked without fetching the chat's user"""
+        user = basic_user(accept_terms=True)
+        chat = Chat.objects.get(pk=Chat.objects.create(user=user).pk)
+
+        with django_assert_num_queries(0):
+            assert can_access_chat(user, chat)
+
+    def test_user_cannot_access_other_chat(self, user_pool):
         """Test user cannot access another user's chat"""
-        user1 = basic_user(username="user1", accept_terms=True)
-        user2 = basic_user(username="user2", accept_terms=True)
+        users = user_pool("user1", "user2", accept_terms=True)
+        user1, user2 = users["user1"], users["user2"]
         chat = Chat.objects.create(user=user2)
 
         assert not can_access_chat(user1, chat)
         assert not user1.has_perm("chat.access_chat", chat)
 
-    def test_preset_sharing_everyone(self, basic_user):
+    def test_preset_sharing_everyone(self, user_pool, chat_options):
         """Test preset shared with everyone"""
-        owner = basic_user(username="owner", accept_terms=True)
-        other_user = basic_user(username="other", accept_terms=True)
+        users = user_pool("owner", "other", accept_terms=True)
+        owner, other_user = users["owner"], users["other"]
 
-        options = ChatOptions.objects.create()
         preset = Preset.objects.create(
             owner=owner,
             name_en="Public Preset",
-            options=options,
+            options=chat_options,
             sharing_option="everyone"
         )
 
         assert can_access_preset(owner, preset)
         assert can_access_preset(other_user, preset)
 
-    def test_preset_sharing_specific_users(self, basic_user):
+    def test_preset_sharing_specific_users(self, user_pool, chat_options):
         """Test preset shared with specific users"""
-        owner = basic_user(username="owner", accept_terms=True)
-        allowed_user = basic_user(username="allowed", accept_terms=True)
-        blocked_user = basic_user(username="blocked", accept_terms=True)
+        users = user_pool("owner", "allowed", "blocked", accept_terms=True)
+        owner = users["owner"]
+        allowed_user = users["allowed"]
+        blocked_user = users["blocked"]
 
-        options = ChatOptions.objects.create()
         preset = Preset.objects.create(
             owner=owner,
             name_en="Shared Preset",
-            options=options,
+            options=chat_options,
             sharing_option="others"
         )
         preset.accessible_to.add(allowed_user)
@@ -312,17 +350,16 @@ class TestChatAccessAuthorization:
         assert can_access_preset(allowed_user, preset)
         assert not can_access_preset(blocked_user, preset)
 
-    def test_preset_edit_permissions(self, basic_user, all_apps_user):
+    def test_preset_edit_permissions(self, user_pool, all_apps_user, chat_options):
         """Test preset edit permissions"""
-        owner = basic_user(username="owner", accept_terms=True)
-        other_user = basic_user(username="other", accept_terms=True)
+        users = user_pool("owner", "other", accept_terms=True)
+        owner, other_user = users["owner"], users["other"]
         admin = all_apps_user()
 
-        options = ChatOptions.objects.create()
         preset = Preset.objects.create(
             owner=owner,
             name_en="User Preset",
-            options=options
+            options=chat_options
         )
 
         # Owner can edit
@@ -334,16 +371,17 @@ class TestChatAccessAuthorization:
         # Admin cannot edit user's preset
         assert not can_edit_preset(admin, preset)
 
-    def test_global_default_preset_restrictions(self, all_apps_user, basic_user):
+    def test_global_default_preset_restrictions(
+        self, all_apps_user, basic_user, chat_options
+    ):
         """Test that global default presets have special restrictions"""
         admin = all_apps_user()
         user = basic_user(accept_terms=True)
 
-        options = ChatOptions.objects.create()
         global_preset = Preset.objects.create(
             owner=None,
             name_en="Global Default",
-            options=options,
+            options=chat_options,
             english_default=True
         )
 
@@ -360,6 +398,7 @@ class TestChatAccessAuthorization:
 # ==================== Library Access Authorization Tests ====================
 
 @pytest.mark.django_db
+@pytest.mark.xdist_group(name="auth_TestLibraryAccessAuthorization")
 class TestLibraryAccessAuthorization:
     """Test librarian access control"""
 
@@ -374,6 +413,20 @@ class TestLibraryAccessAuthorization:
 
         assert can_view_library(user, public_library)
 
+    def test_public_library_view_skips_role_lookup(
+        self, basic_user, django_assert_num_queries
+    ):
+        """Test that viewing a public library does not query library roles"""
+        user = basic_user()
+        public_library = Library.objects.create(
+            name="Public Library",
+            is_public=True,
+            created_by=user
+        )
+
+        with django_assert_num_queries(0):
+            assert can_view_library(user, public_library)
+
     def test_private_library_view_access(self, basic_user):
         """Test private library access requires role"""
         owner = basic_user(username="owner")
@@ -408,9 +461,13 @@ class TestLibraryAccessAuthorization:
             created_by=admin_user
         )
 
-        LibraryUserRole.objects.create(user=admin_user, library=library, role="admin")
-        LibraryUserRole.objects.create(user=contributor, library=library, role="contributor")
-        LibraryUserRole.objects.create(user=viewer, library=library, role="viewer")
+        LibraryUserRole.objects.bulk_create(
+            [
+                LibraryUserRole(user=admin_user, library=library, role="admin"),
+                LibraryUserRole(user=contributor, library=library, role="contributor"),
+                LibraryUserRole(user=viewer, library=library, role="viewer"),
+            ]
+        )
 
         # Admin and contributor can edit
         assert can_edit_library(admin_user, library)
@@ -430,8 +487,12 @@ class TestLibraryAccessAuthorization:
             created_by=admin_user
         )
 
-        LibraryUserRole.objects.create(user=admin_user, library=library, role="admin")
-        LibraryUserRole.objects.create(user=contributor, library=library, role="contributor")
+        LibraryUserRole.objects.bulk_create(
+            [
+                LibraryUserRole(user=admin_user, library=library, role="admin"),
+                LibraryUserRole(user=contributor, library=library, role="contributor"),
+            ]
+        )
 
         # Only admin can delete
         assert can_delete_library(admin_user, library)
@@ -460,8 +521,12 @@ class TestLibraryAccessAuthorization:
             created_by=library_admin
         )
 
-        LibraryUserRole.objects.create(user=library_admin, library=library, role="admin")
-        LibraryUserRole.objects.create(user=contributor, library=library, role="contributor")
+        LibraryUserRole.objects.bulk_create(
+            [
+                LibraryUserRole(user=library_admin, library=library, role="admin"),
+                LibraryUserRole(user=contributor, library=library, role="contributor"),
+            ]
+        )
 
         # Library admin can manage users
         assert can_manage_library_users(library_admin, library)
@@ -475,13 +540,14 @@ class TestLibraryAccessAuthorization:
 
 # ==================== Decorator Tests ====================
 
-@pytest.mark.django_db
+@pytest.mark.xdist_group(name="auth_TestAuthorizationDecorators")
 class TestAuthorizationDecorators:
     """Test authorization decorator enforcement"""
 
-    def test_permission_required_decorator_allows_access(self, basic_user):
+    def test_permission_required_decorator_allows_access(self):
         """Test permission_required decorator allows authorized users"""
-        user = basic_user(accept_terms=True)
+        # The decorator only asks the user for its permissions, so no saved user
+        user = Mock(spec=User, has_perms=Mock(return_value=True))
         request = RequestFactory().get('/')
         request.user = user
 
@@ -493,28 +559,21 @@ class TestAuthorizationDecorators:
         # This test verifies the decorator exists and doesn't crash
         result = test_view(request)
         assert result == "success"
+        user.has_perms.assert_called_once_with(("otto.access_otto",), None)
 
-    def test_budget_required_decorator_blocks_over_budget(self, basic_user):
+    @pytest.mark.django_db
+    def test_budget_required_decorator_blocks_over_budget(
+        self, basic_user, monkeypatch
+    ):
         """Test budget_required decorator blocks users over budget"""
         user = basic_user(accept_terms=True)
-
-        # Set user budget and create costs exceeding it
         user.monthly_max = 10  # $10 CAD limit
-        user.save()
 
-        cost_type = CostType.objects.create(
-            name="Test Cost",
-            unit_cost=Decimal("1.0"),
-            unit_quantity=1
-        )
-
-        # Create cost that exceeds budget (15 USD * 1.38 exchange rate = 20.7 CAD > 10 CAD)
-        Cost.objects.create(
-            cost_type=cost_type,
-            count=1,
-            usd_cost=Decimal("15.0"),
-            user=user
+        # Costs exceeding the budget (15 USD * 1.38 exchange rate = 20.7 CAD > 10 CAD)
+        monkeypatch.setattr(
+            Cost.objects, "get_user_cost_this_month", lambda user: FIFTEEN_USD
         )
+        assert user.is_over_budget
 
         request = RequestFactory().get('/')
         request.user = user
@@ -533,30 +592,26 @@ class TestAuthorizationDecorators:
 # ==================== Administrative Permission Tests ====================
 
 @pytest.mark.django_db
+@pytest.mark.no_personal_library
+@pytest.mark.xdist_group(name="auth_TestAdministrativePermissions")
 class TestAdministrativePermissions:
     """Test administrative-level permissions"""
 
-    def test_admin_can_manage_users(self, all_apps_user):
-        """Test admin can manage users"""
-        admin = all_apps_user()
-        assert admin.has_perm("otto.manage_users")
-
-    def test_admin_can_load_laws(self, all_apps_user):
-        """Test admin can load laws"""
+    def test_admin_has_administrative_permissions(self, all_apps_user):
+        """Test admin can manage users, load laws, manage feedback, etc."""
+        # One admin for every permission rather than one per test
         admin = all_apps_user()
-        assert admin.has_perm("otto.load_laws")
-
-    def test_admin_can_manage_feedback(self, all_apps_user):
-        """Test admin can manage feedback"""
-        admin = all_apps_user()
-        assert admin.has_perm("otto.manage_feedback")
-
-    def test_operations_admin_can_manage_feedback(self, basic_user):
+        missing = {
+            perm for perm in ADMINISTRATIVE_PERMISSIONS if not admin.has_perm(perm)
+        }
+        assert not missing
+
+    def test_operations_admin_can_manage_feedback(
+        self, basic_user, operations_admin_group
+    ):
         """Test operations admin can manage feedback"""
         ops_admin = basic_user()
-        ops_group, _ = Group.objects.get_or_create(name="Operations admin")
-        ops_admin.groups.add(ops_group)
-        ops_admin.save()
+        ops_admin.groups.add(operations_admin_group)
 
         assert ops_admin.has_perm("otto.manage_feedback")
         assert ops_admin.has_perm("otto.manage_cost_dashboard")
@@ -574,16 +629,18 @@ class TestAdministrativePermissions:
 # ==================== Multi-User Scenario Tests ====================
 
 @pytest.mark.django_db
+@pytest.mark.xdist_group(name="auth_TestMultiUserScenarios")
 class TestMultiUserScenarios:
     """Test complex multi-user authorization scenarios"""
 
-    def test_collaborative_library_access(self, basic_user):
+    def test_collaborative_library_access(self, user_pool):
         """Test multiple users collaborating on a library"""
-        admin = basic_user(username="admin")
-        contributor1 = basic_user(username="contributor1")
-        contributor2 = basic_user(username="contributor2")
-        viewer = basic_user(username="viewer")
-        outsider = basic_user(username="outsider")
+        users = user_pool("admin", "contributor1", "contributor2", "viewer", "outsider")
+        admin = users["admin"]
+        contributor1 = users["contributor1"]
+        contributor2 = users["contributor2"]
+        viewer = users["viewer"]
+        outsider = users["outsider"]
 
         library = Library.objects.create(
             name="Collaborative Library",
@@ -591,10 +648,14 @@ class TestMultiUserScenarios:
             created_by=admin
         )
 
-        LibraryUserRole.objects.create(user=admin, library=library, role="admin")
-        LibraryUserRole.objects.create(user=contributor1, library=library, role="contributor")
-        LibraryUserRole.objects.create(user=contributor2, library=library, role="contributor")
-        LibraryUserRole.objects.create(user=viewer, library=library, role="viewer")
+        LibraryUserRole.objects.bulk_create(
+            [
+                LibraryUserRole(user=admin, library=library, role="admin"),
+                LibraryUserRole(user=contributor1, library=library, role="contributor"),
+                LibraryUserRole(user=contributor2, library=library, role="contributor"),
+                LibraryUserRole(user=viewer, library=library, role="viewer"),
+            ]
+        )
 
         # All users with roles can view
         assert can_view_library(admin, library)
@@ -615,11 +676,10 @@ class TestMultiUserScenarios:
         assert can_manage_library_users(admin, library)
         assert not can_manage_library_users(contributor1, library)
 
-    def test_chat_isolation_between_users(self, basic_user):
+    def test_chat_isolation_between_users(self, user_pool):
         """Test that chats are properly isolated between users"""
-        user1 = basic_user(username="user1", accept_terms=True)
-        user2 = basic_user(username="user2", accept_terms=True)
-        user3 = basic_user(username="user3", accept_terms=True)
+        users = user_pool("user1", "user2", "user3", accept_terms=True)
+        user1, user2, user3 = users["user1"], users["user2"], users["user3"]
 
         chat1 = Chat.objects.create(user=user1)
         chat2 = Chat.objects.create(user=user2)
@@ -638,6 +698,7 @@ class TestMultiUserScenarios:
 # ==================== Edge Case Tests ====================
 
 @pytest.mark.django_db
+@pytest.mark.xdist_group(name="auth_TestAuthorizationEdgeCases")
 class TestAuthorizationEdgeCases:
     """Test edge cases in authorization logic"""
 
@@ -678,9 +739,36 @@ class TestAuthorizationEdgeCases:
         # Second call should use cache
         roles2 = get_library_roles_for_user(user)
 
-        assert len(roles1) > 0
+        assert roles1 == {library.id: "admin"}
         assert roles1 == roles2
 
+    def test_library_role_changes_clear_cached_roles(self, basic_user):
+        """Test that role writes during a request aren't hidden by the role cache"""
+        from data_fetcher import _clear_request_cache, _start_request_cache
+        from otto.rules import get_library_roles_for_user
+
+        user = basic_user()
+        library = Library.objects.create(name="Test Library", created_by=user)
+
+        # Start the request cache without the rest of request_started's receivers
+        _start_request_cache()
+        try:
+            get_library_roles_for_user(user)
+
+            role = LibraryUserRole.objects.create(
+                user=user, library=library, role="admin"
+            )
+            assert get_library_roles_for_user(user)[library.id] == "admin"
+
+            role.role = "viewer"
+            role.save()
+            assert get_library_roles_for_user(user)[library.id] == "viewer"
+
+            library.user_roles.all().delete()
+            assert library.id not in get_library_roles_for_user(user)
+        finally:
+            _clear_request_cache()
+
     def test_app_without_user_group(self, basic_user):
         """Test app with no user_group restriction"""
         user = basic_user()
@@ -694,31 +782,18 @@ class TestAuthorizationEdgeCases:
         # Only admins should have access
         assert not can_access_app(user, app)
 
-    def test_budget_calculation_with_exchange_rate(self, basic_user):
+    def test_budget_calculation_with_exchange_rate(self, basic_user, monkeypatch):
         """Test budget calculation considers exchange rate"""
         from otto.utils.common import cad_cost
 
         user = basic_user()
         user.monthly_max = 100  # $100 CAD
-        user.save()
 
-        cost_type = CostType.objects.create(
-            name="Test Cost",
-            unit_cost=Decimal("1.0"),
-            unit_quantity=1
-        )
+        # $50 USD * 1.38 exchange rate = $69 CAD
+        assert cad_cost(FIFTY_USD, exchange_rate=1.38) == pytest.approx(69)
 
-        # Create cost in USD
-        Cost.objects.create(
-            cost_type=cost_type,
-            count=1,
-            usd_cost=Decimal("50.0"),  # $50 USD
-            user=user
+        monkeypatch.setattr(
+            Cost.objects, "get_user_cost_this_month", lambda user: FIFTY_USD
         )
-
-        monthly_cost_usd = Cost.objects.get_user_cost_this_month(user)
-        monthly_cost_cad = cad_cost(monthly_cost_usd)
-
-        # $50 USD * 1.38 exchange rate = $69 CAD
-        assert monthly_cost_cad > 50
+        assert cad_cost(Cost.objects.get_user_cost_this_month(user)) > 50
         assert not user.is_over_budget  # Under $100 CAD limit
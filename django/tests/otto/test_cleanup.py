@@ -431,8 +431,9 @@ def test_delete_text_extractor_files_task(client, all_apps_user):
         content_type=content_type_output_file,
         name="Can delete output file",
     )
-    user.user_permissions.add(permission_output_file_add)
-    user.user_permissions.add(permission_output_file_delete)
+    user.user_permissions.add(
+        permission_output_file_add, permission_output_file_delete
+    )
     # Verify current time
     current_time = timezone.now()
     logger.debug(f"Current time: {current_time}")
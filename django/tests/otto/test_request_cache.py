@@ -0,0 +1,44 @@
+from django.core.signals import request_finished, request_started
+
+from data_fetcher import cache_within_request
+from data_fetcher.util import clear_request_caches
+
+
+def _counting_function():
+    calls = []
+
+    @cache_within_request
+    def double(value):
+        calls.append(value)
+        return value * 2
+
+    return double, calls
+
+
+def test_cache_within_request_caches_during_request():
+    double, calls = _counting_function()
+
+    request_started.send(sender=None)
+    try:
+        assert double(2) == 4
+        assert double(2) == 4
+        assert double(3) == 6
+        assert calls == [2, 3]
+
+        clear_request_caches()
+        assert double(2) == 4
+        assert calls == [2, 3, 2]
+    finally:
+        request_finished.send(sender=None)
+
+
+def test_cache_within_request_does_not_cache_outside_request():
+    double, calls = _counting_function()
+
+    request_started.send(sender=None)
+    double(2)
+    request_finished.send(sender=None)
+
+    assert double(2) == 4
+    assert double(2) == 4
+    assert calls == [2, 2, 2]
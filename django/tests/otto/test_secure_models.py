@@ -10,6 +10,8 @@ This test suite covers:
 - Logging and audit trail verification
 """
 
+import uuid
+
 import pytest
 from django.contrib.auth import get_user_model
 from django.contrib.contenttypes.models import ContentType
@@ -22,15 +24,73 @@ from text_extractor.models import UserRequest  # Using UserRequest as example Se
 User = get_user_model()
 
 
+@pytest.fixture()
+def user_request_ct(db):
+    # Served from ContentTypeManager's process-wide cache after the first lookup
+    return ContentType.objects.get_for_model(UserRequest)
+
+
+@pytest.fixture(scope="class")
+def bypass_key():
+    # AccessKey holds no state beyond its arguments, so one per class is enough
+    return AccessKey(bypass=True)
+
+
+@pytest.fixture()
+def user_requests(db):
+    """
+    Three UserRequests shared by the SecureManager tests, with no access controls.
+    conftest's django_db_setup resets app data before every test, so these can't
+    be created once per class.
+    """
+    return make_user_requests("Library 1", "Library 2", "Library 3")
+
+
+def make_user_requests(*names):
+    """
+    Create UserRequests with the given names in a single INSERT.
+    Like objects.create with a bypass key, no access controls are granted; use
+    grant or bulk_grant afterwards for the access a test needs.
+    """
+    return UserRequest._base_manager.bulk_create(
+        [UserRequest(id=uuid.uuid4(), name=name) for name in names]
+    )
+
+
+def grant(user, obj, *permissions):
+    """Grant the user the given permissions on obj, e.g. grant(user, lib, CAN_VIEW)"""
+    return AccessControl.grant_permissions(
+        user=user, content_object=obj, required_permissions=list(permissions)
+    )
+
+
+def bulk_grant(user_obj_pairs, *permissions):
+    """Grant the same permissions on each (user, obj) pair in one batch"""
+    return AccessControl.grant_permissions_bulk(
+        [(user, obj, list(permissions)) for user, obj in user_obj_pairs]
+    )
+
+
+def assert_ids(queryset, expected):
+    """
+    Assert that the queryset returns exactly the expected objects, fetching the
+    ids in one query rather than a COUNT followed by a SELECT.
+    """
+    ids = list(queryset.values_list("id", flat=True))
+    assert len(ids) == len(expected)
+    assert set(ids) == {obj.id for obj in expected}
+
+
 # ==================== AccessKey Tests ====================
 
-@pytest.mark.django_db
+@pytest.mark.no_db
 class TestAccessKey:
     """Test AccessKey creation and validation"""
 
-    def test_access_key_with_user(self, basic_user):
+    def test_access_key_with_user(self):
         """Test creating AccessKey with valid user"""
-        user = basic_user()
+        # AccessKey only holds the user, so it doesn't need to be saved
+        user = User(upn="access.key@example.com")
         access_key = AccessKey(user=user)
         assert access_key.user == user
         assert access_key.bypass is False
@@ -55,387 +115,343 @@ class TestAccessKey:
 # ==================== AccessControl Tests ====================
 
 @pytest.mark.django_db
+@pytest.mark.no_personal_library
 class TestAccessControl:
     """Test AccessControl model for permission management"""
 
-    def test_grant_view_permission(self, basic_user):
-        """Test granting view permission to a user"""
-        user = basic_user()
-        request = UserRequest.objects.create(
-            access_key=AccessKey(bypass=True),
-            name="Test Library"
-        )
-
-        AccessControl.grant_permissions(
-            user=user,
-            content_object=request,
-            required_permissions=[AccessControl.CAN_VIEW],
-            reason="Test grant view"
-        )
-
-        # Verify permission was granted
-        assert AccessControl.check_permissions(
-            user=user,
-            content_object=request,
-            required_permissions=[AccessControl.CAN_VIEW]
-        )
-
-    def test_grant_multiple_permissions(self, basic_user):
-        """Test granting multiple permissions at once"""
+    @pytest.mark.parametrize(
+        "permissions",
+        [
+            [AccessControl.CAN_VIEW],
+            [AccessControl.CAN_CHANGE],
+            AccessControl.valid_permissions(),
+        ],
+        ids=["view", "change", "all"],
+    )
+    def test_grant_and_check_permissions(self, basic_user, user_request, permissions):
+        """Test that granted permissions, and only those, are checked as present"""
         user = basic_user()
-        request = UserRequest.objects.create(
-            access_key=AccessKey(bypass=True),
-            name="Test Library"
-        )
 
         AccessControl.grant_permissions(
             user=user,
-            content_object=request,
-            required_permissions=[
-                AccessControl.CAN_VIEW,
-                AccessControl.CAN_CHANGE,
-                AccessControl.CAN_DELETE
-            ],
-            reason="Test grant all"
+            content_object=user_request,
+            required_permissions=permissions,
+            reason="Test grant",
         )
 
-        # Verify all permissions were granted
         assert AccessControl.check_permissions(
             user=user,
-            content_object=request,
-            required_permissions=[
-                AccessControl.CAN_VIEW,
-                AccessControl.CAN_CHANGE,
-                AccessControl.CAN_DELETE
-            ]
-        )
-
-    def test_grant_empty_permissions_raises_error(self, basic_user):
-        """Test that granting empty permissions list raises ValueError"""
-        user = basic_user()
-        request = UserRequest.objects.create(
-            access_key=AccessKey(bypass=True),
-            name="Test Library"
-        )
-
-        with pytest.raises(ValueError, match="At least one permission should be granted"):
-            AccessControl.grant_permissions(
-                user=user,
-                content_object=request,
-                required_permissions=[],
-                reason="Test invalid"
-            )
-
-    def test_grant_invalid_permission_raises_error(self, basic_user):
-        """Test that granting invalid permission raises ValueError"""
+            content_object=user_request,
+            required_permissions=permissions,
+        )
+        assert AccessControl.get_permission_set(user, user_request) == set(permissions)
+
+    @pytest.mark.parametrize(
+        "permissions, error",
+        [
+            ([], "At least one permission should be granted"),
+            (["invalid_permission"], "Invalid permissions specified"),
+        ],
+        ids=["empty", "invalid"],
+    )
+    def test_grant_bad_permissions_raises_error(
+        self, basic_user, user_request, permissions, error
+    ):
+        """Test that granting no permissions or an invalid one raises ValueError"""
         user = basic_user()
-        request = UserRequest.objects.create(
-            access_key=AccessKey(bypass=True),
-            name="Test Library"
-        )
 
-        with pytest.raises(ValueError, match="Invalid permissions specified"):
+        with pytest.raises(ValueError, match=error):
             AccessControl.grant_permissions(
                 user=user,
-                content_object=request,
-                required_permissions=["invalid_permission"],
+                content_object=user_request,
+                required_permissions=permissions,
                 reason="Test invalid"
             )
 
-    def test_revoke_specific_permission(self, basic_user):
-        """Test revoking a specific permission"""
+    @pytest.mark.parametrize(
+        "revoked, remaining",
+        [
+            (
+                [AccessControl.CAN_DELETE],
+                {AccessControl.CAN_VIEW, AccessControl.CAN_CHANGE},
+            ),
+            (None, set()),
+        ],
+        ids=["specific", "all"],
+    )
+    def test_revoke_permissions(self, basic_user, user_request, revoked, remaining):
+        """Test revoking specific permissions, or all of them when none are given"""
         user = basic_user()
-        request = UserRequest.objects.create(
-            access_key=AccessKey(bypass=True),
-            name="Test Library"
-        )
 
         # Grant all permissions
         AccessControl.grant_permissions(
             user=user,
-            content_object=request,
-            required_permissions=[
-                AccessControl.CAN_VIEW,
-                AccessControl.CAN_CHANGE,
-                AccessControl.CAN_DELETE
-            ]
-        )
-
-        # Revoke delete permission
-        AccessControl.revoke_permissions(
-            user=user,
-            content_object=request,
-            revoked_permissions=[AccessControl.CAN_DELETE],
-            reason="Test revoke delete"
-        )
-
-        # Verify view and change remain, delete is gone
-        assert AccessControl.check_permissions(
-            user=user,
-            content_object=request,
-            required_permissions=[AccessControl.CAN_VIEW, AccessControl.CAN_CHANGE]
-        )
-        assert not AccessControl.check_permissions(
-            user=user,
-            content_object=request,
-            required_permissions=[AccessControl.CAN_DELETE]
-        )
-
-    def test_revoke_all_permissions(self, basic_user):
-        """Test revoking all permissions (no params)"""
-        user = basic_user()
-        request = UserRequest.objects.create(
-            access_key=AccessKey(bypass=True),
-            name="Test Library"
-        )
-
-        # Grant permissions
-        AccessControl.grant_permissions(
-            user=user,
-            content_object=request,
-            required_permissions=[AccessControl.CAN_VIEW]
+            content_object=user_request,
+            required_permissions=AccessControl.valid_permissions(),
         )
 
-        # Revoke all permissions
         AccessControl.revoke_permissions(
             user=user,
-            content_object=request,
-            reason="Test revoke all"
+            content_object=user_request,
+            revoked_permissions=revoked,
+            reason="Test revoke",
         )
 
-        # Verify no permissions remain
-        assert not AccessControl.check_permissions(
-            user=user,
-            content_object=request,
-            required_permissions=[AccessControl.CAN_VIEW]
-        )
+        assert AccessControl.get_permission_set(user, user_request) == remaining
 
-    def test_revoke_invalid_permission_raises_error(self, basic_user):
+    def test_revoke_invalid_permission_raises_error(self, basic_user, user_request):
         """Test that revoking invalid permission raises ValueError"""
         user = basic_user()
-        request = UserRequest.objects.create(
-            access_key=AccessKey(bypass=True),
-            name="Test Library"
-        )
 
         with pytest.raises(ValueError, match="Invalid permissions specified"):
             AccessControl.revoke_permissions(
                 user=user,
-                content_object=request,
+                content_object=user_request,
                 revoked_permissions=["invalid_permission"]
             )
 
-    def test_check_permissions_no_access_control(self, basic_user):
+    def test_check_permissions_bulk(
+        self, basic_user, user_request, django_assert_num_queries
+    ):
+        """Test checking several permission lists in one query"""
+        user = basic_user()
+        permission_lists = [
+            [AccessControl.CAN_VIEW],
+            [AccessControl.CAN_VIEW, AccessControl.CAN_CHANGE],
+            [],
+        ]
+
+        # Without an AccessControl, nothing is granted
+        assert AccessControl.check_permissions_bulk(
+            user, user_request, permission_lists
+        ) == [False, False, False]
+
+        grant(user, user_request, AccessControl.CAN_VIEW)
+
+        with django_assert_num_queries(1):
+            results = AccessControl.check_permissions_bulk(
+                user, user_request, permission_lists
+            )
+        assert results == [
+            AccessControl.check_permissions(user, user_request, permissions)
+            for permissions in permission_lists
+        ]
+        assert results == [True, False, True]
+
+    def test_check_permissions_no_access_control(self, basic_user, user_request):
         """Test checking permissions when no AccessControl exists returns False"""
         user = basic_user()
-        request = UserRequest.objects.create(
-            access_key=AccessKey(bypass=True),
-            name="Test Library"
-        )
 
         # Check permissions without granting any
         assert not AccessControl.check_permissions(
             user=user,
-            content_object=request,
+            content_object=user_request,
             required_permissions=[AccessControl.CAN_VIEW]
         )
+        assert AccessControl.get_permission_set(user, user_request) == frozenset()
 
-    def test_access_control_logging_on_create(self, basic_user):
+    @pytest.mark.audit_log
+    def test_access_control_logging_on_create(self, basic_user, user_request):
         """Test that AccessControlLog entry is created on permission grant"""
         user = basic_user()
-        request = UserRequest.objects.create(
-            access_key=AccessKey(bypass=True),
-            name="Test Library"
-        )
-
-        initial_log_count = AccessControlLog.objects.count()
 
         AccessControl.grant_permissions(
             user=user,
-            content_object=request,
+            content_object=user_request,
             required_permissions=[AccessControl.CAN_VIEW],
             reason="Test logging"
         )
 
-        # Verify log entry was created
-        assert AccessControlLog.objects.count() == initial_log_count + 1
+        # Verify a single log entry was created for the user
+        log_entries = list(AccessControlLog.objects.filter(upn=user.upn)[:2])
+        assert len(log_entries) == 1
 
-        log_entry = AccessControlLog.objects.latest('modified_at')
+        log_entry = log_entries[0]
         assert log_entry.upn == user.upn
         assert log_entry.action == "C"
         assert log_entry.can_view is True
         assert log_entry.reason == "Test logging"
 
-    def test_access_control_unique_constraint(self, basic_user):
-        """Test that unique constraint prevents duplicate AccessControl entries"""
+    def test_access_control_logging_disabled(self, basic_user, user_request):
+        """Test that no AccessControlLog entry is written when auditing is off"""
         user = basic_user()
-        request = UserRequest.objects.create(
-            access_key=AccessKey(bypass=True),
-            name="Test Library"
+
+        AccessControl.grant_permissions(
+            user=user,
+            content_object=user_request,
+            required_permissions=[AccessControl.CAN_VIEW],
+        )
+        AccessControl.revoke_permissions(user=user, content_object=user_request)
+
+        assert not AccessControlLog.objects.filter(upn=user.upn).exists()
+
+    @pytest.mark.audit_log
+    def test_grant_permissions_bulk_matches_grant_permissions(
+        self, basic_user, user_request
+    ):
+        """Test bulk grants create, update and log like individual grants"""
+        user1 = basic_user(username="user1")
+        user2 = basic_user(username="user2")
+        AccessControl.grant_permissions(
+            user=user1,
+            content_object=user_request,
+            required_permissions=[AccessControl.CAN_VIEW]
+        )
+
+        AccessControl.grant_permissions_bulk(
+            [
+                (user1, user_request, [AccessControl.CAN_CHANGE]),
+                (user2, user_request, [AccessControl.CAN_VIEW]),
+            ],
+            reason="Bulk grant"
+        )
+
+        # Existing grants are replaced, as with grant_permissions
+        assert AccessControl.check_permissions_bulk(
+            user1, user_request, [[AccessControl.CAN_VIEW], [AccessControl.CAN_CHANGE]]
+        ) == [False, True]
+        assert AccessControl.check_permissions(
+            user2, user_request, [AccessControl.CAN_VIEW]
         )
-        content_type = ContentType.objects.get_for_model(request)
+        assert user_request.access_controls.count() == 2
+
+        logs = AccessControlLog.objects.filter(reason="Bulk grant")
+        assert {(log.upn, log.action, log.reason) for log in logs} == {
+            (user1.upn, "U", "Bulk grant"),
+            (user2.upn, "C", "Bulk grant"),
+        }
+
+    def test_grant_permissions_bulk_validates_every_grant(
+        self, basic_user, user_request
+    ):
+        """Test that one invalid grant rejects the whole batch"""
+        user = basic_user()
+
+        with pytest.raises(ValueError, match="Invalid permissions specified"):
+            AccessControl.grant_permissions_bulk(
+                [
+                    (user, user_request, [AccessControl.CAN_VIEW]),
+                    (user, user_request, ["invalid_permission"]),
+                ]
+            )
+        assert not AccessControl.objects.filter(user=user).exists()
+
+    def test_access_control_unique_constraint(
+        self, basic_user, user_request, user_request_ct
+    ):
+        """Test that unique constraint prevents duplicate AccessControl entries"""
+        user = basic_user()
 
         # Create first AccessControl
         AccessControl.objects.create(
             user=user,
-            content_type=content_type,
-            object_id=request.id,
+            content_type=user_request_ct,
+            object_id=user_request.id,
             can_view=True
         )
 
         # Attempt to create duplicate should update existing
         AccessControl.grant_permissions(
             user=user,
-            content_object=request,
+            content_object=user_request,
             required_permissions=[AccessControl.CAN_VIEW, AccessControl.CAN_CHANGE],
             reason="Update existing"
         )
 
         # Verify only one AccessControl exists
-        assert AccessControl.objects.filter(
+        access_controls = AccessControl.objects.filter(
             user=user,
-            content_type=content_type,
-            object_id=request.id
-        ).count() == 1
+            content_type=user_request_ct,
+            object_id=user_request.id
+        )
+        assert len(access_controls[:2]) == 1
 
 
 # ==================== SecureManager Tests ====================
 
 @pytest.mark.django_db
+@pytest.mark.no_personal_library
 class TestSecureManager:
     """Test SecureManager queryset filtering with row-level security"""
 
-    def test_all_with_bypass_returns_all_objects(self):
+    def test_all_with_bypass_returns_all_objects(self, bypass_key, user_requests):
         """Test that all() with bypass returns all objects"""
-        # Create multiple libraries
-        UserRequest.objects.create(
-            access_key=AccessKey(bypass=True),
-            name="Library 1"
-        )
-        UserRequest.objects.create(
-            access_key=AccessKey(bypass=True),
-            name="Library 2"
+        # Query with bypass, bounded to the seeded rows rather than the whole table
+        libraries = UserRequest.objects.all(
+            access_key=bypass_key, id__in=[lib.id for lib in user_requests]
         )
 
-        # Query with bypass
-        access_key = AccessKey(bypass=True)
-        libraries = UserRequest.objects.all(access_key=access_key)
-
-        assert libraries.count() >= 2
+        assert_ids(libraries, user_requests)
 
-    def test_all_with_user_filters_by_permissions(self, basic_user):
+    def test_all_with_user_filters_by_permissions(self, basic_user, user_requests):
         """Test that all() with user only returns objects user has access to"""
         user = basic_user()
-
-        # Create libraries
-        lib1 = UserRequest.objects.create(
-            access_key=AccessKey(bypass=True),
-            name="Library 1"
-        )
-        lib2 = UserRequest.objects.create(
-            access_key=AccessKey(bypass=True),
-            name="Library 2"
-        )
+        lib1, lib2, lib3 = user_requests
 
         # Grant access to lib1 only
-        AccessControl.grant_permissions(
-            user=user,
-            content_object=lib1,
-            required_permissions=[AccessControl.CAN_VIEW]
-        )
+        grant(user, lib1, AccessControl.CAN_VIEW)
 
         # Query with user access key
         access_key = AccessKey(user=user)
         libraries = UserRequest.objects.all(access_key=access_key)
 
         # Should only see lib1
-        assert libraries.count() == 1
-        assert libraries.first().id == lib1.id
+        assert_ids(libraries, [lib1])
 
-    def test_get_with_permissions(self, basic_user):
+    def test_get_with_permissions(self, basic_user, user_request):
         """Test get() with proper permissions"""
         user = basic_user()
 
-        lib = UserRequest.objects.create(
-            access_key=AccessKey(bypass=True),
-            name="Test Library"
-        )
-
         # Grant access
-        AccessControl.grant_permissions(
-            user=user,
-            content_object=lib,
-            required_permissions=[AccessControl.CAN_VIEW]
-        )
+        grant(user, user_request, AccessControl.CAN_VIEW)
 
         # Get with user access key
         access_key = AccessKey(user=user)
-        result = UserRequest.objects.get(access_key=access_key, id=lib.id)
+        result = UserRequest.objects.get(access_key=access_key, id=user_request.id)
 
-        assert result.id == lib.id
+        assert result.id == user_request.id
 
-    def test_get_without_permissions_raises_error(self, basic_user):
+    def test_get_without_permissions_raises_error(self, basic_user, user_request):
         """Test get() without permissions raises DoesNotExist"""
         user = basic_user()
 
-        lib = UserRequest.objects.create(
-            access_key=AccessKey(bypass=True),
-            name="Test Library"
-        )
-
         # Don't grant access
 
         # Get with user access key should fail
         access_key = AccessKey(user=user)
         with pytest.raises(UserRequest.DoesNotExist):
-            UserRequest.objects.get(access_key=access_key, id=lib.id)
+            UserRequest.objects.get(access_key=access_key, id=user_request.id)
 
-    def test_filter_with_permissions(self, basic_user):
+    def test_filter_with_permissions(self, basic_user, user_requests):
         """Test filter() respects permissions"""
         user = basic_user()
-
-        lib1 = UserRequest.objects.create(
-            access_key=AccessKey(bypass=True),
-            name="Library 1"
-        )
-        lib2 = UserRequest.objects.create(
-            access_key=AccessKey(bypass=True),
-            name="Library 2"
-        )
-        lib3 = UserRequest.objects.create(
-            access_key=AccessKey(bypass=True),
-            name="Library 3"
-        )
+        lib1, lib2, lib3 = user_requests
 
         # Grant access to lib1 and lib2 only
-        for lib in [lib1, lib2]:
-            AccessControl.grant_permissions(
-                user=user,
-                content_object=lib,
-                required_permissions=[AccessControl.CAN_VIEW]
-            )
+        bulk_grant([(user, lib1), (user, lib2)], AccessControl.CAN_VIEW)
 
         # Filter with user access key
         access_key = AccessKey(user=user)
         libraries = UserRequest.objects.filter(access_key=access_key)
 
-        assert libraries.count() == 2
-        assert set(libraries.values_list('id', flat=True)) == {lib1.id, lib2.id}
+        assert_ids(libraries, [lib1, lib2])
 
 
 # ==================== SecureModel CRUD Tests ====================
 
 @pytest.mark.django_db
+@pytest.mark.no_personal_library
 class TestSecureModelCRUD:
     """Test CRUD operations on SecureModel with permission enforcement"""
 
-    def test_create_with_bypass(self):
+    def test_create_with_bypass(self, bypass_key, django_assert_num_queries):
         """Test creating object with bypass grants full permissions"""
-        access_key = AccessKey(bypass=True)
-        lib = UserRequest.objects.create(
-            access_key=access_key,
-            name="Test Library"
-        )
+        # A single INSERT, with no UPDATE attempted for the new UUID
+        with django_assert_num_queries(1):
+            lib = UserRequest.objects.create(
+                access_key=bypass_key,
+                name="Test Library"
+            )
 
         assert lib.id is not None
         assert lib.name == "Test Library"
@@ -461,236 +477,173 @@ class TestSecureModelCRUD:
             ]
         )
 
-    def test_save_with_bypass(self):
+    def test_secure_writes_queue_no_on_commit_callbacks(
+        self, basic_user, django_capture_on_commit_callbacks
+    ):
+        """
+        SecureModel writes and their permission grants finish inside the test's
+        savepoint, so these tests don't need transaction=True.
+        """
+        user = basic_user()
+        access_key = AccessKey(user=user)
+
+        with django_capture_on_commit_callbacks() as callbacks:
+            lib = UserRequest.objects.create(access_key=access_key, name="Test Library")
+            lib.name = "Updated Name"
+            lib.save(access_key=access_key)
+            lib.delete(access_key=access_key)
+
+        assert callbacks == []
+
+    def test_save_with_bypass(self, bypass_key, user_request):
         """Test saving object with bypass"""
-        lib = UserRequest.objects.create(
-            access_key=AccessKey(bypass=True),
-            name="Original Name"
-        )
 
-        lib.name = "Updated Name"
-        lib.save(access_key=AccessKey(bypass=True))
+        user_request.name = "Updated Name"
+        user_request.save(access_key=bypass_key)
 
-        lib.refresh_from_db()
-        assert lib.name == "Updated Name"
+        assert (
+            UserRequest._base_manager.values_list("name", flat=True).get(
+                id=user_request.id
+            )
+            == "Updated Name"
+        )
 
-    def test_save_with_change_permission(self, basic_user):
+    def test_save_with_change_permission(self, basic_user, user_request):
         """Test saving object with change permission"""
         user = basic_user()
 
-        lib = UserRequest.objects.create(
-            access_key=AccessKey(bypass=True),
-            name="Original Name"
-        )
-
         # Grant change permission
-        AccessControl.grant_permissions(
-            user=user,
-            content_object=lib,
-            required_permissions=[AccessControl.CAN_VIEW, AccessControl.CAN_CHANGE]
-        )
+        grant(user, user_request, AccessControl.CAN_VIEW, AccessControl.CAN_CHANGE)
 
         # Update with user access key
-        lib.name = "Updated Name"
-        lib.save(access_key=AccessKey(user=user))
+        user_request.name = "Updated Name"
+        user_request.save(access_key=AccessKey(user=user))
 
-        lib.refresh_from_db()
-        assert lib.name == "Updated Name"
+        assert (
+            UserRequest._base_manager.values_list("name", flat=True).get(
+                id=user_request.id
+            )
+            == "Updated Name"
+        )
 
-    def test_save_without_change_permission_raises_error(self, basic_user):
+    def test_save_without_change_permission_raises_error(self, basic_user, user_request):
         """Test saving without change permission raises PermissionDenied"""
         user = basic_user()
 
-        lib = UserRequest.objects.create(
-            access_key=AccessKey(bypass=True),
-            name="Original Name"
-        )
-
         # Grant only view permission
-        AccessControl.grant_permissions(
-            user=user,
-            content_object=lib,
-            required_permissions=[AccessControl.CAN_VIEW]
-        )
+        grant(user, user_request, AccessControl.CAN_VIEW)
 
         # Attempt to update should fail
-        lib.name = "Updated Name"
+        user_request.name = "Updated Name"
         with pytest.raises(PermissionDenied):
-            lib.save(access_key=AccessKey(user=user))
+            user_request.save(access_key=AccessKey(user=user))
 
-    def test_delete_with_bypass(self):
+    def test_delete_with_bypass(self, bypass_key, user_request):
         """Test deleting object with bypass"""
-        lib = UserRequest.objects.create(
-            access_key=AccessKey(bypass=True),
-            name="Test Library"
-        )
-        lib_id = lib.id
+        lib_id = user_request.id
 
-        lib.delete(access_key=AccessKey(bypass=True))
+        user_request.delete(access_key=bypass_key)
 
-        assert not UserRequest.objects.filter(access_key=AccessKey(bypass=True), id=lib_id).exists()
+        assert not UserRequest._base_manager.filter(id=lib_id).exists()
 
-    def test_delete_with_delete_permission(self, basic_user):
+    def test_delete_with_delete_permission(self, basic_user, user_request):
         """Test deleting object with delete permission"""
         user = basic_user()
 
-        lib = UserRequest.objects.create(
-            access_key=AccessKey(bypass=True),
-            name="Test Library"
-        )
-
         # Grant delete permission
-        AccessControl.grant_permissions(
-            user=user,
-            content_object=lib,
-            required_permissions=[AccessControl.CAN_VIEW, AccessControl.CAN_DELETE]
-        )
+        grant(user, user_request, AccessControl.CAN_VIEW, AccessControl.CAN_DELETE)
 
-        lib_id = lib.id
-        lib.delete(access_key=AccessKey(user=user))
+        lib_id = user_request.id
+        user_request.delete(access_key=AccessKey(user=user))
 
-        assert not UserRequest.objects.filter(access_key=AccessKey(bypass=True), id=lib_id).exists()
+        assert not UserRequest._base_manager.filter(id=lib_id).exists()
 
-    def test_delete_without_delete_permission_raises_error(self, basic_user):
+    def test_delete_without_delete_permission_raises_error(self, basic_user, user_request):
         """Test deleting without delete permission raises PermissionDenied"""
         user = basic_user()
 
-        lib = UserRequest.objects.create(
-            access_key=AccessKey(bypass=True),
-            name="Test Library"
-        )
-
         # Grant only view permission
-        AccessControl.grant_permissions(
-            user=user,
-            content_object=lib,
-            required_permissions=[AccessControl.CAN_VIEW]
-        )
+        grant(user, user_request, AccessControl.CAN_VIEW)
 
         # Attempt to delete should fail
         with pytest.raises(PermissionDenied):
-            lib.delete(access_key=AccessKey(user=user))
+            user_request.delete(access_key=AccessKey(user=user))
 
 
 # ==================== Edge Cases and Error Conditions ====================
 
 @pytest.mark.django_db
+@pytest.mark.no_personal_library
 class TestEdgeCases:
     """Test edge cases and error conditions"""
 
-    def test_multiple_users_different_permissions(self, basic_user):
+    def test_multiple_users_different_permissions(self, basic_user, user_request):
         """Test that different users can have different permissions on same object"""
         user1 = basic_user(username="user1")
         user2 = basic_user(username="user2")
 
-        lib = UserRequest.objects.create(
-            access_key=AccessKey(bypass=True),
-            name="Shared Library"
-        )
-
         # Grant view to user1, full permissions to user2
-        AccessControl.grant_permissions(
-            user=user1,
-            content_object=lib,
-            required_permissions=[AccessControl.CAN_VIEW]
-        )
-        AccessControl.grant_permissions(
-            user=user2,
-            content_object=lib,
-            required_permissions=[
-                AccessControl.CAN_VIEW,
-                AccessControl.CAN_CHANGE,
-                AccessControl.CAN_DELETE
+        AccessControl.grant_permissions_bulk(
+            [
+                (user1, user_request, [AccessControl.CAN_VIEW]),
+                (user2, user_request, AccessControl.valid_permissions()),
             ]
         )
 
         # Verify user1 has limited access
-        assert AccessControl.check_permissions(
-            user=user1,
-            content_object=lib,
-            required_permissions=[AccessControl.CAN_VIEW]
-        )
-        assert not AccessControl.check_permissions(
-            user=user1,
-            content_object=lib,
-            required_permissions=[AccessControl.CAN_DELETE]
-        )
+        assert AccessControl.get_permission_set(user1, user_request) == {
+            AccessControl.CAN_VIEW
+        }
 
         # Verify user2 has full access
-        assert AccessControl.check_permissions(
-            user=user2,
-            content_object=lib,
-            required_permissions=[
-                AccessControl.CAN_VIEW,
-                AccessControl.CAN_CHANGE,
-                AccessControl.CAN_DELETE
-            ]
+        assert AccessControl.get_permission_set(user2, user_request) == set(
+            AccessControl.valid_permissions()
         )
 
     def test_permission_inheritance_not_automatic(self, basic_user):
         """Test that permissions are not inherited (e.g., from groups)"""
         user = basic_user()
-
-        lib = UserRequest.objects.create(
-            access_key=AccessKey(bypass=True),
-            name="Test Library"
-        )
+        # Only the id is looked up, so the object needn't be saved
+        user_request = UserRequest(id=uuid.uuid4(), name="Test Library")
 
         # Don't grant permissions
 
         # User should not have access even if they might have group permissions
         assert not AccessControl.check_permissions(
             user=user,
-            content_object=lib,
+            content_object=user_request,
             required_permissions=[AccessControl.CAN_VIEW]
         )
 
-    def test_cascade_deletion_removes_access_controls(self, basic_user):
+    def test_cascade_deletion_removes_access_controls(
+        self, basic_user, bypass_key, user_request, user_request_ct
+    ):
         """Test that deleting an object cascades to AccessControl entries"""
         user = basic_user()
 
-        lib = UserRequest.objects.create(
-            access_key=AccessKey(bypass=True),
-            name="Test Library"
-        )
+        grant(user, user_request, AccessControl.CAN_VIEW)
 
-        AccessControl.grant_permissions(
-            user=user,
-            content_object=lib,
-            required_permissions=[AccessControl.CAN_VIEW]
-        )
-
-        content_type = ContentType.objects.get_for_model(UserRequest)
         assert AccessControl.objects.filter(
             user=user,
-            content_type=content_type,
-            object_id=lib.id
+            content_type=user_request_ct,
+            object_id=user_request.id
         ).exists()
 
         # Delete the request
-        lib.delete(access_key=AccessKey(bypass=True))
+        user_request.delete(access_key=bypass_key)
 
         # AccessControl entries should be removed
         assert not AccessControl.objects.filter(
             user=user,
-            content_type=content_type,
-            object_id=lib.id
+            content_type=user_request_ct,
+            object_id=user_request.id
         ).exists()
 
-    def test_user_deletion_removes_access_controls(self, basic_user):
+    def test_user_deletion_removes_access_controls(self, basic_user, user_request):
         """Test that deleting a user cascades to their AccessControl entries"""
         user = basic_user()
 
-        lib = UserRequest.objects.create(
-            access_key=AccessKey(bypass=True),
-            name="Test Library"
-        )
-
-        AccessControl.grant_permissions(
-            user=user,
-            content_object=lib,
-            required_permissions=[AccessControl.CAN_VIEW]
-        )
+        grant(user, user_request, AccessControl.CAN_VIEW)
 
         assert AccessControl.objects.filter(user=user).exists()
 
@@ -703,37 +656,18 @@ class TestEdgeCases:
         # AccessControl entries should be removed
         assert not AccessControl.objects.filter(user_id=user_id).exists()
 
-    def test_update_permissions_replaces_existing(self, basic_user):
+    def test_update_permissions_replaces_existing(self, basic_user, user_request):
         """Test that updating permissions replaces existing ones"""
         user = basic_user()
 
-        lib = UserRequest.objects.create(
-            access_key=AccessKey(bypass=True),
-            name="Test Library"
-        )
-
         # Grant view permission
-        AccessControl.grant_permissions(
-            user=user,
-            content_object=lib,
-            required_permissions=[AccessControl.CAN_VIEW]
-        )
+        grant(user, user_request, AccessControl.CAN_VIEW)
 
         # Update to grant change and delete, but not view
-        AccessControl.grant_permissions(
-            user=user,
-            content_object=lib,
-            required_permissions=[AccessControl.CAN_CHANGE, AccessControl.CAN_DELETE]
-        )
+        grant(user, user_request, AccessControl.CAN_CHANGE, AccessControl.CAN_DELETE)
 
         # Verify view is gone, change and delete are present
-        assert not AccessControl.check_permissions(
-            user=user,
-            content_object=lib,
-            required_permissions=[AccessControl.CAN_VIEW]
-        )
-        assert AccessControl.check_permissions(
-            user=user,
-            content_object=lib,
-            required_permissions=[AccessControl.CAN_CHANGE, AccessControl.CAN_DELETE]
-        )
+        assert AccessControl.get_permission_set(user, user_request) == {
+            AccessControl.CAN_CHANGE,
+            AccessControl.CAN_DELETE,
+        }
@@ -15,3 +15,10 @@ def test_get_app_from_path():
     assert get_app_from_path("http://localhost:8000") == "Otto"
     assert get_app_from_path("http://localhost:8000/laws/nested/path/") == "laws"
     assert get_app_from_path("") == "Otto"
+
+
+def test_cad_cost_with_exchange_rate():
+    from otto.utils.common import cad_cost
+
+    assert cad_cost(10, exchange_rate=1.5) == 15.0
+    assert cad_cost(0, exchange_rate=1.38) == 0.0
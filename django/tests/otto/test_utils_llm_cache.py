@@ -0,0 +1,72 @@
+from unittest import mock
+
+from django.test import override_settings
+
+from llama_index.core.llms import MockLLM
+
+from otto.utils.llm_cache import LLMCache
+
+locmem_cache = {
+    "default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}
+}
+
+
+def _mock_llm(temperature=0):
+    llm = mock.MagicMock()
+    llm.deployment = "models/gemini-1.5-flash-latest"
+    llm.system_prompt = "Translate the following text to Canadian French (fr-ca):"
+    llm.temperature = temperature
+    llm.use_mock_llm = False
+    llm.complete.return_value = "Bonjour"
+    return llm
+
+
+@override_settings(CACHES=locmem_cache)
+def test_llm_cache_returns_cached_response():
+    llm_cache = LLMCache()
+    llm = _mock_llm()
+
+    assert llm_cache.complete(llm, "Hello") == "Bonjour"
+    assert llm_cache.complete(llm, "Hello") == "Bonjour"
+
+    assert llm.complete.call_count == 1
+
+
+@override_settings(CACHES=locmem_cache)
+def test_llm_cache_key_includes_system_prompt():
+    assert LLMCache.make_key("model", "Hello", "Translate to French") != (
+        LLMCache.make_key("model", "Hello", "Translate to English")
+    )
+    assert LLMCache.make_key("model", "Hello") == LLMCache.make_key("model", "Hello")
+
+
+@override_settings(CACHES=locmem_cache)
+def test_llm_cache_skips_nondeterministic_calls():
+    llm_cache = LLMCache()
+    llm = _mock_llm(temperature=0.1)
+
+    llm_cache.complete(llm, "Hello")
+    llm_cache.complete(llm, "Hello")
+
+    assert llm.complete.call_count == 2
+
+
+@override_settings(CACHES=locmem_cache)
+def test_llm_cache_skips_mock_llm():
+    llm_cache = LLMCache()
+    mock_context_llm = _mock_llm()
+    mock_context_llm.use_mock_llm = True
+    no_key_llm = _mock_llm()
+    no_key_llm.llm = MockLLM(max_tokens=50)
+
+    for llm in (mock_context_llm, no_key_llm):
+        llm_cache.complete(llm, "Hello")
+        llm_cache.complete(llm, "Hello")
+        assert llm.complete.call_count == 2
+
+    assert (
+        llm_cache.get(
+            mock_context_llm.deployment, "Hello", mock_context_llm.system_prompt
+        )
+        is None
+    )
@@ -0,0 +1,65 @@
+import json
+from unittest import mock
+
+from otto.utils.localization import LocaleTranslator
+
+
+def _numbered_response(translations):
+    return "\n".join(
+        f"{i}. {json.dumps(text, ensure_ascii=False)}"
+        for i, text in enumerate(translations, start=1)
+    )
+
+
+def test_translate_batch_parses_numbered_response():
+    mock_llm = mock.MagicMock()
+    mock_llm.complete.return_value = _numbered_response(["Bonjour", "Au revoir"])
+
+    with mock.patch("chat.llm.OttoLLM", return_value=mock_llm):
+        translations = LocaleTranslator().translate_batch(["Hello", "Goodbye"])
+
+    assert translations == ["Bonjour", "Au revoir"]
+    assert mock_llm.complete.call_count == 1
+    mock_llm.create_costs.assert_called_once()
+
+
+def test_translate_batch_splits_into_batches():
+    # Batches are sent concurrently, so respond based on the prompt, not call order
+    def complete(prompt):
+        if '"One"' in prompt:
+            return _numbered_response(["Un", "Deux"])
+        return _numbered_response(["Trois"])
+
+    mock_llm = mock.MagicMock()
+    mock_llm.complete.side_effect = complete
+
+    with mock.patch("chat.llm.OttoLLM", return_value=mock_llm):
+        translations = LocaleTranslator().translate_batch(
+            ["One", "Two", "Three"], batch_size=2
+        )
+
+    assert translations == ["Un", "Deux", "Trois"]
+    assert mock_llm.complete.call_count == 2
+    mock_llm.create_costs.assert_called_once()
+
+
+def test_translate_batch_falls_back_on_unparseable_response():
+    mock_llm = mock.MagicMock()
+    mock_llm.complete.side_effect = ["Sorry, I can't do that", "Bonjour", "Au revoir"]
+
+    with mock.patch("chat.llm.OttoLLM", return_value=mock_llm):
+        translations = LocaleTranslator().translate_batch(["Hello", "Goodbye"])
+
+    assert translations == ["Bonjour", "Au revoir"]
+    assert mock_llm.complete.call_count == 3
+    mock_llm.create_costs.assert_called_once()
+
+
+def test_translate_text_skips_untranslatable_strings():
+    with mock.patch("chat.llm.OttoLLM") as mock_otto_llm:
+        translator = LocaleTranslator()
+        assert translator.translate_text("%s") == "%s"
+        assert translator.translate_text(": 42") == ": 42"
+        assert translator.translate_text("A") == "A"
+
+    mock_otto_llm.assert_not_called()
@@ -32,7 +32,7 @@ class TestExtractTextTask:
     """Test extract_text_task Celery task"""
 
     @patch('chat.models.ChatFile.objects.get')
-    @patch('librarian.utils.process_engine.extract_markdown')
+    @patch('chat.tasks.extract_markdown')
     def test_extract_text_task_success(self, mock_extract, mock_get_file):
         """Test successful text extraction from ChatFile"""
         # Setup
@@ -57,6 +57,32 @@ class TestExtractTextTask:
         mock_file.save.assert_called_once()
         assert mock_file.text == "Extracted text content"
 
+    @patch('chat.models.ChatFile.objects.get')
+    @patch('chat.tasks.get_process_engine_from_type')
+    @patch('chat.tasks.extract_markdown')
+    def test_extract_text_task_sniffs_file_header(
+        self, mock_extract, mock_get_engine, mock_get_file
+    ):
+        """Test the file is read once and only its first 64 KiB are sniffed"""
+        # Setup
+        file_id = uuid.uuid4()
+        content = b"plain text\n" * 8000 + b"<html></html>"
+        mock_file = Mock()
+        mock_file.filename = "notes"
+        mock_file.saved_file.content_type = ""
+        file_handle = mock_file.saved_file.file.open.return_value.__enter__.return_value
+        file_handle.read.return_value = content
+        mock_get_file.return_value = mock_file
+        mock_extract.return_value = Mock(markdown="Extracted text content")
+
+        # Execute
+        extract_text_task(str(file_id))
+
+        # Verify: the late <html marker is outside the sniffed header
+        file_handle.read.assert_called_once_with()
+        mock_get_engine.assert_called_once_with("text/plain")
+        assert mock_extract.call_args.args[0] == content
+
     @patch('chat.models.ChatFile.objects.get')
     def test_extract_text_task_file_not_found(self, mock_get_file):
         """Test extract_text_task with non-existent file"""
@@ -84,7 +110,7 @@ class TestExtractTextTask:
             extract_text_task(str(file_id))
 
     @patch('chat.models.ChatFile.objects.get')
-    @patch('librarian.utils.process_engine.extract_markdown')
+    @patch('chat.tasks.extract_markdown')
     def test_extract_text_task_extraction_error(self, mock_extract, mock_get_file):
         """Test extract_text_task when extraction fails"""
         file_id = uuid.uuid4()
@@ -102,7 +128,7 @@ class TestExtractTextTask:
             extract_text_task(str(file_id))
 
     @patch('chat.models.ChatFile.objects.get')
-    @patch('librarian.utils.process_engine.extract_markdown')
+    @patch('chat.tasks.extract_markdown')
     def test_extract_text_task_with_context_vars(self, mock_extract, mock_get_file):
         """Test extract_text_task with context variables for cost tracking"""
         file_id = uuid.uuid4()
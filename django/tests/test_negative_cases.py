@@ -29,7 +29,7 @@ from django.urls import reverse
 
 from otto.models import User, Feedback, Pilot
 from otto.forms import FeedbackForm, UserGroupForm, PilotForm
-from chat.models import Chat, ChatOptions, Message, Preset
+from chat.models import Chat, Message, Preset
 from chat.forms import PresetForm
 from librarian.models import Library, DataSource, Document
 from librarian.forms import LibraryDetailForm, DataSourceDetailForm, DocumentDetailForm
@@ -247,16 +247,15 @@ class TestPermissionDenied:
 
         assert not user1.has_perm('chat.access_chat', chat)
 
-    def test_user_cannot_edit_other_user_preset(self, basic_user):
+    def test_user_cannot_edit_other_user_preset(self, basic_user, chat_options):
         """Test users cannot edit other users' presets"""
         owner = basic_user(username="owner", accept_terms=True)
         other_user = basic_user(username="other", accept_terms=True)
 
-        options = ChatOptions.objects.create()
         preset = Preset.objects.create(
             owner=owner,
             name_en="Private Preset",
-            options=options
+            options=chat_options
         )
 
         assert not other_user.has_perm('chat.edit_preset', preset)
@@ -253,11 +253,9 @@ def test_download_all_zip(client, all_apps_user):
         content_type=content_type_output_file,
         name="Can add output file",
     )
-    group.permissions.add(permission_user_request)
-    group.permissions.add(permission_output_file_add)
+    group.permissions.add(permission_user_request, permission_output_file_add)
     user.groups.add(group)
-    user.user_permissions.add(permission_user_request)
-    user.user_permissions.add(permission_output_file_add)
+    user.user_permissions.add(permission_user_request, permission_output_file_add)
 
     user_request = UserRequest.objects.create(
         access_key=access_key, name="Test Request"